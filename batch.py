@@ -0,0 +1,69 @@
+"""Расчеты без графического интерфейса: PyQt6 и matplotlib не загружаются.
+
+    python batch.py calculate params.csv results.csv [--distribution weibull]
+    python batch.py export scenarios.csv curves.xlsx --distribution weibull
+
+calculate — для каждой строки входного файла (CSV, JSON или xlsx) считает то же,
+что окно распределения. Столбцы строки:
+
+* distribution — normal, expon, weibull, binomial или poisson (или --distribution);
+* параметры распределения — mu, sigma; lambda_value или mtbf; shape_k, scale_lambda;
+  n, p; n и p или lambda_value;
+* непрерывные: time → f_t = f(t), cdf_t = F(t), reliability = R(t), failure_rate = λ(t);
+  reliability_level → time_for_reliability; max_failure_probability → replacement_time;
+* дискретные: m → pmf, cdf; a, b → probability_range (биномиальное); k и для
+  распределения Пуассона lambda_np = n·p считаются всегда.
+
+Результаты пишутся в CSV, JSON или xlsx по расширению выходного файла.
+
+export — пакетный экспорт кривых и таблиц, как кнопка «Пакетный экспорт» окна:
+сценарии из CSV с именами полей параметров в заголовке, результат в xlsx, CSV,
+Parquet, Arrow или npz.
+"""
+import argparse
+import sys
+import time
+
+from engine.batch import export_batch, read_scenarios
+from engine.calculator import DISTRIBUTIONS, calculate_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Расчеты надежности без графического интерфейса")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    calculate = commands.add_parser("calculate", help="величины окон распределений по строкам файла")
+    calculate.add_argument("input", help="входной файл: .csv, .json или .xlsx")
+    calculate.add_argument("output", help="файл результатов: .csv, .json или .xlsx")
+    calculate.add_argument("--distribution", choices=list(DISTRIBUTIONS),
+                           help="распределение для строк без столбца distribution")
+    calculate.add_argument("--workers", type=int, default=None,
+                           help="число процессов (по умолчанию по числу ядер)")
+
+    export = commands.add_parser("export", help="пакетный экспорт кривых по сценариям")
+    export.add_argument("input", help="CSV со сценариями: заголовок — имена полей параметров")
+    export.add_argument("output", help="файл экспорта: .xlsx, .csv, .parquet, .arrow или .npz")
+    export.add_argument("--distribution", choices=list(DISTRIBUTIONS), required=True)
+    export.add_argument("--workers", type=int, default=None,
+                        help="число процессов (по умолчанию по числу ядер)")
+
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        if args.command == "calculate":
+            count = f"{calculate_file(args.input, args.output, args.distribution, args.workers)} строк"
+        else:
+            scenarios = read_scenarios(args.input, DISTRIBUTIONS[args.distribution])
+            export_batch(args.output, scenarios, args.workers)
+            count = f"{len(scenarios)} сценариев"
+    except (OSError, ValueError, RuntimeError) as error:
+        print(f"Ошибка: {error}", file=sys.stderr)
+        return 1
+
+    print(f"{args.output}: {count} за {time.perf_counter() - start:.2f} с")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
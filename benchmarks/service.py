@@ -0,0 +1,154 @@
+"""Замер задержки и пропускной способности service.py под локальной нагрузкой.
+
+Сервис запускается отдельным процессом дважды: с пачками запросов (по
+умолчанию) и без них (--delay 0, каждый запрос считается отдельно). Генератор
+нагрузки держит --connections соединений keep-alive, в каждом запросы идут
+один за другим; строки запросов — случайная смесь распределений и величин
+с фиксированным зерном.
+
+    python benchmarks/service.py                           # 64 соединения по 200 запросов
+    python benchmarks/service.py --connections 256 --requests 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE = os.path.join(ROOT, "service.py")
+
+CONNECTIONS = 64
+REQUESTS = 200
+SEED = 1
+
+# Режимы сервиса: название и аргументы командной строки
+MODES = (
+    ("Пачки", []),
+    ("Без пачек", ["--delay", "0"]),
+)
+
+
+def make_rows(count, seed=SEED):
+    """Строки запросов: все распределения и все входные величины окон."""
+    generator = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        distribution = generator.choice(["normal", "expon", "weibull", "binomial", "poisson"])
+        if distribution == "normal":
+            row = {"mu": generator.uniform(500, 1500), "sigma": generator.uniform(50, 200)}
+        elif distribution == "expon":
+            row = {"lambda_value": generator.uniform(1e-4, 1e-2)}
+        elif distribution == "weibull":
+            row = {"shape_k": generator.uniform(0.5, 4), "scale_lambda": generator.uniform(500, 5000)}
+        elif distribution == "binomial":
+            row = {"n": generator.randint(10, 1000), "p": generator.uniform(0.01, 0.5),
+                   "m": generator.randint(0, 10), "a": 1, "b": generator.randint(2, 20)}
+        else:
+            row = {"n": generator.randint(10, 1000), "lambda_value": generator.uniform(0.5, 10),
+                   "m": generator.randint(0, 10)}
+        if distribution in ("normal", "expon", "weibull"):
+            row.update(time=generator.uniform(0, 2000), reliability_level=generator.uniform(0.5, 0.99),
+                       max_failure_probability=generator.uniform(0.01, 0.5))
+        rows.append({"distribution": distribution, **row})
+    return rows
+
+
+def start_service(arguments):
+    """Процесс сервиса на свободном порту и номер порта."""
+    process = subprocess.Popen([sys.executable, SERVICE, "--port", "0", *arguments], cwd=ROOT,
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line:
+        process.kill()
+        raise RuntimeError("Сервис не запустился")
+    # «Сервис расчетов: http://127.0.0.1:<порт>/calculate»
+    return process, int(line.rsplit(":", 1)[1].split("/")[0])
+
+
+async def request(reader, writer, method, path, body=b""):
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = next(int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                  if line.lower().startswith(b"content-length:"))
+    payload = await reader.readexactly(length)
+    if status != 200:
+        raise RuntimeError(f"Ответ {status}: {payload.decode('utf-8')}")
+    return json.loads(payload)
+
+
+async def client(port, bodies, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            await request(reader, writer, "POST", "/calculate", body)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def load(port, connections, requests):
+    """Нагрузка: (число запросов, секунды, задержки, статистика сервиса)."""
+    rows = make_rows(connections * requests)
+    bodies = [json.dumps(row).encode("utf-8") for row in rows]
+    latencies = []
+
+    # Прогрев: первые вызовы формул загружают модули scipy
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for body in bodies[:50]:
+        await request(reader, writer, "POST", "/calculate", body)
+    before = await request(reader, writer, "GET", "/stats")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, bodies[number::connections], latencies)
+                           for number in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    after = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    stats = {key: after[key] - before[key] for key in after}
+    return len(bodies), elapsed, latencies, stats
+
+
+def measure(arguments, connections, requests):
+    process, port = start_service(arguments)
+    try:
+        return asyncio.run(load(port, connections, requests))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замер задержки и пропускной способности service.py")
+    parser.add_argument("--connections", type=int, default=CONNECTIONS, help="одновременных соединений")
+    parser.add_argument("--requests", type=int, default=REQUESTS, help="запросов на соединение")
+    args = parser.parse_args()
+
+    print(f"{'Режим':<14}{'запр/с':>10}{'p50, мс':>10}{'p95, мс':>10}{'p99, мс':>10}{'пачка':>10}")
+    for name, arguments in MODES:
+        count, elapsed, latencies, stats = measure(arguments, args.connections, args.requests)
+        batch = stats["requests"] / stats["batches"] if stats["batches"] else 0
+        print(f"{name:<14}{count / elapsed:>10.0f}"
+              f"{statistics.median(latencies) * 1000:>10.2f}"
+              f"{percentile(latencies, 0.95) * 1000:>10.2f}"
+              f"{percentile(latencies, 0.99) * 1000:>10.2f}"
+              f"{batch:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Замер времени запуска приложения и первого открытия окон распределений.
+
+Каждый замер выполняется в отдельном процессе ``python -X importtime`` под
+QT_QPA_PLATFORM=offscreen:
+
+* запуск — от старта интерпретатора до первой отрисовки MainWindow;
+* окно — от двойного нажатия в списке до первой отрисовки окна распределения
+  (модули окна при этом еще не загружены, фоновый прогрев отключен).
+
+Время импорта суммируется по пакетам верхнего уровня (numpy, scipy, PyQt6, ...).
+Считаются только импорты после начала startup_child.py: модули, которые
+загружает сам интерпретатор и site (в том числе sitecustomize окружения), к
+приложению не относятся.
+Результаты сравниваются с файлом startup_baseline.json рядом со скриптом.
+
+    python benchmarks/startup.py                    # замер и сравнение с базой
+    python benchmarks/startup.py --save-baseline    # записать новую базу
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+# Дочерний процесс вынесен в отдельный файл, чтобы импорты этого скрипта не попадали в замер
+CHILD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_child.py")
+
+WINDOWS = ["PoissonWindow", "BinomialWindow", "NormalWindow", "ExponWindow", "WeibullWindow"]
+
+# Строка, которую startup_child.py первой печатает в stderr
+STARTED = "startup_child: started"
+
+REPEAT = 5
+# Допустимое замедление относительно базы: в разах и абсолютное, мс
+TOLERANCE = 1.25
+SLACK_MS = 50.0
+
+
+def parse_importtime(stderr):
+    """Собственное время импорта (мс), просуммированное по пакетам верхнего уровня."""
+    lines = stderr.splitlines()
+    if STARTED in lines:
+        lines = lines[lines.index(STARTED) + 1:]
+    packages = {}
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(self_us) / 1000
+    return packages
+
+
+def run(window=None):
+    """Один замер в новом процессе: (время до первой отрисовки, время открытия окна, импорты)."""
+    command = [sys.executable, "-X", "importtime", CHILD]
+    if window is not None:
+        command.append(window)
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+
+    # Вывод -X importtime велик: через канал он заблокировал бы дочерний процесс
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as errors:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=ROOT, env=env, text=True,
+                                   stdout=subprocess.PIPE, stderr=errors)
+        painted = None
+        opened = None
+        for line in process.stdout:
+            if line.startswith("painted") and painted is None:
+                painted = (time.perf_counter() - start) * 1000
+            elif line.startswith("opened"):
+                opened = float(line.split()[1]) * 1000
+        returncode = process.wait()
+        errors.seek(0)
+        stderr = errors.read()
+    if returncode != 0 or painted is None:
+        raise RuntimeError(f"Замер завершился с ошибкой:\n{stderr[-2000:]}")
+    return painted, opened, parse_importtime(stderr)
+
+
+def _median_imports(runs, exclude=None):
+    # Медиана по запускам для каждого пакета, за вычетом импортов exclude (уже загруженных при старте)
+    packages = {package for _, _, imports in runs for package in imports}
+    result = {}
+    for package in packages:
+        value = statistics.median(imports.get(package, 0.0) for _, _, imports in runs)
+        if exclude:
+            value -= exclude.get(package, 0.0)
+        if value > 0:
+            result[package] = round(value, 1)
+    return dict(sorted(result.items()))
+
+
+def measure(repeat):
+    """Медианы по repeat запускам для старта и каждого окна."""
+    startup = [run() for _ in range(repeat)]
+    result = {
+        "startup_ms": round(statistics.median(painted for painted, _, _ in startup), 1),
+        "windows_ms": {},
+        "imports_ms": {"startup": _median_imports(startup)},
+    }
+    for window in WINDOWS:
+        runs = [run(window) for _ in range(repeat)]
+        result["windows_ms"][window] = round(statistics.median(opened for _, opened, _ in runs), 1)
+        result["imports_ms"][window] = _median_imports(runs, result["imports_ms"]["startup"])
+    return result
+
+
+def report(result, baseline, top):
+    rows = [("Запуск до первой отрисовки", result["startup_ms"],
+             baseline and baseline["startup_ms"])]
+    for window, value in result["windows_ms"].items():
+        rows.append((f"Первое открытие {window}", value,
+                     baseline and baseline["windows_ms"].get(window)))
+
+    print(f"{'Замер':<40}{'мс':>10}{'база':>10}")
+    regressions = []
+    for name, value, base in rows:
+        base_text = f"{base:>10.1f}" if base else f"{'-':>10}"
+        mark = ""
+        if base and value > base * TOLERANCE + SLACK_MS:
+            mark = "  регрессия"
+            regressions.append(name)
+        print(f"{name:<40}{value:>10.1f}{base_text}{mark}")
+
+    # Время импорта по пакетам: при старте и дополнительно при первом открытии каждого окна
+    columns = list(result["imports_ms"])
+    total = {}
+    for imports in result["imports_ms"].values():
+        for package, value in imports.items():
+            total[package] = total.get(package, 0.0) + value
+    packages = sorted(total, key=total.get, reverse=True)[:top]
+
+    print()
+    print(f"{'Импорт по пакетам, мс':<24}" + "".join(f"{column[:15]:>16}" for column in columns))
+    for package in packages:
+        print(f"{package:<24}" + "".join(f"{result['imports_ms'][column].get(package, 0.0):>16.1f}"
+                                          for column in columns))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замер времени запуска и открытия окон")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="число запусков на замер")
+    parser.add_argument("--top", type=int, default=15, help="сколько пакетов показать")
+    parser.add_argument("--baseline", default=BASELINE, help="файл базовых значений")
+    parser.add_argument("--save-baseline", action="store_true", help="записать результат как базу")
+    args = parser.parse_args()
+
+    result = measure(args.repeat)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    regressions = report(result, baseline, args.top)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+        print(f"\nБаза записана в {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\nЗамедление относительно базы: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Дочерний процесс benchmarks/startup.py: повторяет main.py и сообщает о первой отрисовке.
+
+    python -X importtime benchmarks/startup_child.py [ИмяОкна]
+
+Печатает «painted», когда отрисовано главное окно. Если задано имя окна, затем
+открывает его из списка, как двойное нажатие, и печатает «opened <секунды>»
+после его первой отрисовки.
+
+Первой печатает в stderr строку startup.STARTED: импорты до нее выполнил
+интерпретатор и site, а не приложение.
+"""
+import sys
+
+print("startup_child: started", file=sys.stderr, flush=True)
+
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+import main_window
+from windows.theme import apply_theme
+
+
+class FirstPaint(QObject):
+    """Вызывает callback после первого события отрисовки любого виджета окна target()."""
+
+    def __init__(self, target, callback):
+        super().__init__()
+        self.target = target
+        self.callback = callback
+
+    def eventFilter(self, obj, event):
+        if (self.callback is not None and event.type() == QEvent.Type.Paint
+                and obj.isWidgetType() and obj.window() is self.target()):
+            callback, self.callback = self.callback, None
+            QTimer.singleShot(0, callback)
+        return False
+
+
+def main(window_name=None):
+    # Замеряется холодное открытие окна, без фонового прогрева модулей
+    main_window.PREWARM = False
+
+    app = QApplication(sys.argv[:1])
+    apply_theme(app)
+    window = main_window.MainWindow()
+    opened = {}
+
+    def main_painted():
+        print("painted", flush=True)
+        if window_name is None:
+            app.quit()
+            return
+        row = [class_name for _, class_name in main_window.DISTRIBUTION_WINDOWS].index(window_name)
+        # Открытое окно — новое окно верхнего уровня, появившееся после вызова
+        before = set(app.topLevelWidgets())
+        app.removeEventFilter(main_filter)
+        app.installEventFilter(window_filter)
+        opened["start"] = time.perf_counter()
+        window.open_distribution_window(window.distribution_model.index(row, 0))
+        opened["window"] = next(widget for widget in app.topLevelWidgets() if widget not in before)
+
+    def window_painted():
+        print(f"opened {time.perf_counter() - opened['start']:.6f}", flush=True)
+        app.quit()
+
+    main_filter = FirstPaint(lambda: window, main_painted)
+    window_filter = FirstPaint(lambda: opened.get("window"), window_painted)
+    app.installEventFilter(main_filter)
+    window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:2]))
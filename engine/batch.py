@@ -0,0 +1,144 @@
+import csv
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+
+import numpy as np
+from engine.export import export_table, workbook_file, write_sheet
+
+
+# Лист книги с параметрами всех сценариев
+INDEX_SHEET = "Сценарии"
+# Меньше сценариев считается в текущем процессе: запуск пула дороже расчета
+MIN_PARALLEL = 8
+
+
+def scenario_fields(params_class):
+    """Поля параметров, которые задаются в файле сценариев."""
+    return [item for item in fields(params_class) if item.init]
+
+
+def read_scenarios(file_name, params_class):
+    """Наборы параметров из CSV-файла, по одному в строке.
+
+    Первая строка — имена полей params_class, например «shape_k,scale_lambda»
+    для WeibullParams; порядок и лишние столбцы не важны. Значения должны
+    быть в пределах, которые допускают поля окна (см. is_valid классов параметров).
+    """
+    items = scenario_fields(params_class)
+    with open(file_name, encoding="utf-8-sig", newline="") as file:
+        reader = csv.DictReader(file)
+        missing = [item.name for item in items if item.name not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"В файле сценариев нет столбцов: {', '.join(missing)}")
+
+        scenarios = []
+        for row in reader:
+            try:
+                scenario = params_class(**{item.name: item.type(row[item.name].strip()) for item in items})
+                # Те же пределы, что у полей окна: иначе лист сценария состоял бы из nan
+                if not scenario.is_valid():
+                    raise ValueError
+                scenarios.append(scenario)
+            except Exception:
+                raise ValueError(f"Неверные параметры в строке {reader.line_num}: "
+                                 f"{', '.join(row[item.name] or '' for item in items)}") from None
+    if not scenarios:
+        raise ValueError("В файле сценариев нет ни одной строки параметров")
+    return scenarios
+
+
+def evaluate(params):
+    """Столбцы и параметры одного сценария; выполняется в процессе пула."""
+    return params.export_data()
+
+
+def iter_results(scenarios, workers=None):
+    """Результаты evaluate() в порядке сценариев, посчитанные на пуле процессов.
+
+    workers — число процессов, по умолчанию по числу ядер.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(scenarios) < MIN_PARALLEL:
+        yield from map(evaluate, scenarios)
+        return
+
+    # spawn: процесс окна многопоточный (Qt, пул потоков), fork из него небезопасен
+    executor = ProcessPoolExecutor(min(workers, len(scenarios)),
+                                   mp_context=multiprocessing.get_context("spawn"))
+    try:
+        # Сценарии передаются пачками, чтобы не платить за пересылку каждого отдельно
+        chunksize = max(1, len(scenarios) // (4 * workers))
+        yield from executor.map(evaluate, scenarios, chunksize=chunksize)
+    finally:
+        # При отмене несделанные пачки не запускаются
+        executor.shutdown(cancel_futures=True)
+
+
+def _index_row(number, sheet_name, parameters):
+    return {"№": number, "Лист": sheet_name, **parameters}
+
+
+def _index_table(rows):
+    return {header: np.array([row[header] for row in rows], dtype=object) for header in rows[0]}
+
+
+def export_workbook(file_name, scenarios, workers=None, progress=None):
+    """Все сценарии в одну книгу: лист на сценарий и лист INDEX_SHEET с их параметрами.
+
+    Листы пишутся по мере готовности сценариев, в памяти остается только текущий.
+    """
+    sheet_name = scenarios[0].sheet_name
+    total = len(scenarios) + 1  # Последний шаг — сохранение книги
+    index = []
+
+    with workbook_file(file_name) as workbook:
+        for number, (data, parameters) in enumerate(iter_results(scenarios, workers), 1):
+            # Имя листа Excel — не длиннее 31 символа
+            name = f"{sheet_name[:24]} {number}"
+            write_sheet(workbook, name, data, {})
+            index.append(_index_row(number, name, parameters))
+            if progress is not None:
+                progress(number, total)
+
+        write_sheet(workbook, INDEX_SHEET, _index_table(index), {}, index=0)
+    return file_name
+
+
+def long_table(results):
+    """Сценарии одной таблицей в длинном формате.
+
+    Столбцы: номер сценария, параметры сценария (повторяются в каждой его строке)
+    и столбцы данных.
+    """
+    sizes = [len(next(iter(data.values()))) for data, _ in results]
+    table = {"Сценарий": np.repeat(np.arange(1, len(results) + 1), sizes)}
+    for label in results[0][1]:
+        table[label] = np.repeat(np.array([float(parameters[label]) for _, parameters in results]), sizes)
+    for header in results[0][0]:
+        table[header] = np.concatenate([data[header] for data, _ in results])
+    return table
+
+
+def export_batch(file_name, scenarios, workers=None, progress=None):
+    """Экспорт многих наборов параметров одного распределения за один запуск.
+
+    В Excel каждый сценарий пишется на свой лист (см. export_workbook), в CSV,
+    Parquet, Arrow и npz — одной таблицей в длинном формате (см. long_table).
+    """
+    if os.path.splitext(file_name)[1].lower() == ".xlsx":
+        return export_workbook(file_name, scenarios, workers, progress)
+
+    results = []
+    for number, result in enumerate(iter_results(scenarios, workers), 1):
+        results.append(result)
+        if progress is not None:
+            progress(number, len(scenarios) + 1)
+    parameters = {"Распределение": scenarios[0].distribution, "Число сценариев": len(scenarios)}
+    return export_table(file_name, scenarios[0].sheet_name, long_table(results), parameters, {})
+
+
+def export_scenarios(scenario_file, params_class, file_name, workers=None, progress=None):
+    """Чтение сценариев из CSV (см. read_scenarios) и их пакетный экспорт в file_name."""
+    return export_batch(file_name, read_scenarios(scenario_file, params_class), workers, progress)
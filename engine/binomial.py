@@ -0,0 +1,67 @@
+import numpy as np
+import scipy.stats as stats
+
+
+# Начиная с этого n таблицы строятся только по окну, где сосредоточена вероятность
+LARGE_N = 100_000
+# Допустимая суммарная вероятность отброшенных хвостов
+TAIL_MASS = 1e-12
+
+
+def pmf(m, n, p):
+    """Вероятность появления события m раз в n испытаниях P(X = m)."""
+    return stats.binom.pmf(m, n, p)
+
+
+def cdf(m, n, p):
+    """Вероятность появления события не более m раз P(X ≤ m)."""
+    return stats.binom.cdf(m, n, p)
+
+
+def calculate_probability_range(a, b, n, p):
+    """Вероятность попадания в диапазон P(a ≤ X ≤ b)."""
+    return cdf(b, n, p) - cdf(np.asarray(a) - 1, n, p)
+
+
+def calculate_k(n, p):
+    """Наиболее вероятное число событий (мода) ⌊(n + 1)·p⌋.
+
+    Если (n + 1)·p — целое число, мод две, k и k - 1, и возвращается большая.
+    """
+    return np.minimum(np.floor((np.asarray(n) + 1) * np.asarray(p, dtype=float)), n).astype(np.int64)[()]
+
+
+def support(n, p, tail_mass=TAIL_MASS):
+    """Окно [a, b] вокруг n·p ± c·√(npq), вне которого лежит не более tail_mass вероятности.
+
+    Возвращает границы окна и фактическую вероятность отброшенных хвостов.
+    """
+    mean = n * p
+    deviation = np.sqrt(n * p * (1 - p))
+    c = stats.norm.isf(tail_mass / 2) + 1
+    while True:
+        a = int(max(0, np.floor(mean - c * deviation) - 1))
+        b = int(min(n, np.ceil(mean + c * deviation) + 1))
+        tail = (cdf(a - 1, n, p) if a > 0 else 0.0) + (stats.binom.sf(b, n, p) if b < n else 0.0)
+        # Для p, близких к 0 или 1, нормальное приближение занижает хвост — расширяем окно
+        if tail <= tail_mass or (a == 0 and b == n):
+            return a, b, tail
+        c *= 1.5
+
+
+def window_table(n, p, tail_mass=TAIL_MASS):
+    """Значения m, PMF и CDF только в окне support() и вероятность вне окна."""
+    a, b, tail = support(n, p, tail_mass)
+    m_values = np.arange(a, b + 1)
+    return m_values, pmf(m_values, n, p), cdf(m_values, n, p), tail
+
+
+def table(n, p, tail_mass=TAIL_MASS):
+    """Значения m, PMF и CDF и вероятность отброшенных хвостов.
+
+    При n < LARGE_N таблица строится для всех m от 0 до n, иначе — только для окна support().
+    """
+    if n >= LARGE_N:
+        return window_table(n, p, tail_mass)
+    m_values = np.arange(0, n + 1)
+    return m_values, pmf(m_values, n, p), cdf(m_values, n, p), 0.0
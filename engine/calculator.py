@@ -0,0 +1,360 @@
+import csv
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+from multiprocessing import shared_memory
+
+import numpy as np
+from openpyxl import load_workbook
+
+from engine.batch import scenario_fields
+import engine.binomial as binomial
+from engine.export import export_excel
+from engine.params import BinomialParams, ExponParams, NormalParams, PoissonParams, WeibullParams
+import engine.poisson as poisson
+
+
+# Распределение: класс параметров
+DISTRIBUTIONS = {
+    "normal": NormalParams,
+    "expon": ExponParams,
+    "weibull": WeibullParams,
+    "binomial": BinomialParams,
+    "poisson": PoissonParams,
+}
+
+# Столбцы результатов в порядке вывода
+RESULTS = (
+    "f_t",                   # f(t) — плотность распределения
+    "cdf_t",                 # F(t) — вероятность отказа к времени t
+    "reliability",           # R(t)
+    "failure_rate",          # λ(t)
+    "time_for_reliability",  # Время наработки для надежности reliability_level
+    "replacement_time",      # Минимальное время замены для max_failure_probability
+    "lambda_np",             # λ = n·p распределения Пуассона
+    "k",                     # Наиболее вероятное число событий
+    "pmf",                   # P(X = m)
+    "cdf",                   # P(X ≤ m)
+    "probability_range",     # P(a ≤ X ≤ b)
+)
+# Результаты, которые выводятся целыми числами
+INTEGER_RESULTS = {"k"}
+
+# Входные величины строки по распределениям
+INPUTS = {
+    "normal": ("time", "reliability_level", "max_failure_probability"),
+    "expon": ("time", "reliability_level", "max_failure_probability"),
+    "weibull": ("time", "reliability_level", "max_failure_probability"),
+    "binomial": ("m", "a", "b"),
+    "poisson": ("m",),
+}
+# Входные величины — целые числа
+INTEGER_INPUTS = {"m", "a", "b"}
+
+# Целые входные величины и параметры передаются в формулы массивами int64
+INT_LIMIT = 2 ** 63 - 1
+
+# Меньше строк считается в текущем процессе: запуск процессов пула дороже расчета
+MIN_PARALLEL_ROWS = 20_000
+# Частей на процесс пула: мелкие части выравнивают нагрузку между процессами
+SHARDS_PER_WORKER = 4
+
+
+def _number(row, name, line, kind=Decimal):
+    value = row.get(name)
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        number = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise ValueError(f"Строка {line}: {name} = {value!r} не число") from None
+    # Формулы считают во float: nan, бесконечность и числа вне его диапазона не принимаются
+    if not number.is_finite() or not math.isfinite(float(number)):
+        raise ValueError(f"Строка {line}: {name} = {value!r} не конечное число")
+    if kind is int:
+        # Целые из xlsx и JSON могут прийти как 100.0
+        if number != number.to_integral_value():
+            raise ValueError(f"Строка {line}: {name} = {value!r} не целое число")
+        if abs(number) > INT_LIMIT:
+            raise ValueError(f"Строка {line}: {name} = {value!r} вне диапазона целых чисел")
+        return int(number)
+    return number
+
+
+def _read_params(distribution, row, line):
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Строка {line}: неизвестное распределение {distribution!r}, "
+                         f"ожидается одно из: {', '.join(DISTRIBUTIONS)}")
+
+    if distribution == "expon" and _number(row, "lambda_value", line) is None:
+        # Как в окне: λ можно задать через среднее время наработки на отказ
+        mtbf = _number(row, "mtbf", line)
+        if mtbf is not None:
+            if mtbf <= 0:
+                raise ValueError(f"Строка {line}: mtbf = {mtbf} должно быть больше нуля")
+            return ExponParams(Decimal(1) / mtbf)
+    if distribution == "poisson" and _number(row, "lambda_value", line) is None:
+        # Как в окне: λ = n·p
+        n, p = _number(row, "n", line, int), _number(row, "p", line)
+        if n is not None and p is not None:
+            return PoissonParams(n, Decimal(n) * p)
+
+    params_class = DISTRIBUTIONS[distribution]
+    values = {}
+    for item in scenario_fields(params_class):
+        values[item.name] = _number(row, item.name, line, item.type)
+        if values[item.name] is None:
+            raise ValueError(f"Строка {line}: не задан параметр {item.name} ({distribution})")
+    return params_class(**values)
+
+
+def make_params(distribution, row, line):
+    """Объект параметров из строки входного файла, как его строит окно распределения.
+
+    Параметры должны быть в пределах, которые допускают поля окна (см. is_valid
+    классов параметров), как и в файле сценариев пакетного экспорта.
+    """
+    params = _read_params(distribution, row, line)
+    # Иначе столбцы результатов строки молча состояли бы из nan
+    if not params.is_valid():
+        values = ", ".join(f"{item.name} = {getattr(params, item.name)}" for item in scenario_fields(type(params)))
+        raise ValueError(f"Строка {line}: недопустимые параметры {distribution}: {values}")
+    return params
+
+
+def read_row(row, line, distribution=None):
+    """Параметры и входные величины строки: (объект параметров, {величина: число}).
+
+    Распределение берется из столбца distribution строки, иначе из аргумента.
+    """
+    name = str(row.get("distribution") or distribution or "").strip().lower()
+    params = make_params(name, row, line)
+    inputs = {}
+    for input_name in INPUTS[name]:
+        kind = int if input_name in INTEGER_INPUTS else Decimal
+        value = _number(row, input_name, line, kind)
+        if value is not None:
+            inputs[input_name] = value if kind is int else float(value)
+
+    # Как в полях окна: m, a и b от 0 до n, b не меньше a
+    for input_name in INTEGER_INPUTS & inputs.keys():
+        if not 0 <= inputs[input_name] <= params.n:
+            raise ValueError(f"Строка {line}: {input_name} = {inputs[input_name]} вне диапазона 0..n = {params.n}")
+    if "a" in inputs and "b" in inputs and inputs["b"] < inputs["a"]:
+        raise ValueError(f"Строка {line}: b = {inputs['b']} меньше a = {inputs['a']}")
+    return params, inputs
+
+
+def _poisson_lambda(n, lambda_value):
+    return np.asarray(lambda_value, dtype=float)
+
+
+def _poisson_pmf(m, n, lambda_value):
+    return poisson.pmf(m, lambda_value)
+
+
+def _poisson_cdf(m, n, lambda_value):
+    return poisson.cdf(m, lambda_value)
+
+
+def _formulas(params):
+    # Формулы распределения: входные величины, функция и имена ее результатов.
+    # Функция получает массивы входных величин, затем массивы params.args.
+    if params.distribution in ("normal", "expon", "weibull"):
+        module = params.module
+        return (
+            # Каждая величина — своей функцией: calculate_with_time экспоненциального
+            # закона возвращает F(t) на месте λ(t), как показывает его окно
+            (("time",), module.pdf, ("f_t",)),
+            (("time",), module.cdf, ("cdf_t",)),
+            (("time",), module.reliability, ("reliability",)),
+            (("time",), module.failure_rate, ("failure_rate",)),
+            (("reliability_level",), module.calculate_time_for_reliability, ("time_for_reliability",)),
+            (("max_failure_probability",), module.calculate_replacement_time, ("replacement_time",)),
+        )
+    if params.distribution == "binomial":
+        return (
+            ((), binomial.calculate_k, ("k",)),
+            (("m",), binomial.pmf, ("pmf",)),
+            (("m",), binomial.cdf, ("cdf",)),
+            (("a", "b"), binomial.calculate_probability_range, ("probability_range",)),
+        )
+    return (
+        ((), _poisson_lambda, ("lambda_np",)),
+        ((), poisson.calculate_k, ("k",)),
+        (("m",), _poisson_pmf, ("pmf",)),
+        (("m",), _poisson_cdf, ("cdf",)),
+    )
+
+
+def calculate_many(params_list, inputs_list):
+    """Величины, которые окно распределения показывает, для многих строк одного распределения.
+
+    params_list — объекты параметров одного класса, inputs_list — входные
+    величины строк (см. read_row). Каждая формула вызывается один раз на все
+    строки, где заданы ее входные величины. Возвращает словари результатов
+    {столбец RESULTS: число} в порядке строк.
+    """
+    results = [{} for _ in params_list]
+    if not params_list:
+        return results
+    args = [np.array(column) for column in zip(*(params.args for params in params_list))]
+
+    for names, function, keys in _formulas(params_list[0]):
+        rows = [index for index, inputs in enumerate(inputs_list) if all(name in inputs for name in names)]
+        if not rows:
+            continue
+        values = [np.array([inputs_list[index][name] for index in rows]) for name in names]
+        outputs = function(*values, *(arg[rows] for arg in args))
+        for key, column in zip(keys, outputs if isinstance(outputs, tuple) else (outputs,)):
+            # tolist() переводит столбец в числа Python одним вызовом
+            for index, value in zip(rows, np.broadcast_to(column, len(rows)).tolist()):
+                results[index][key] = value
+    return results
+
+
+def _calculate_into(values, computed, rows, start, distribution):
+    # Результаты строк rows записываются в строки start, start + 1, ... матриц values и computed
+    groups = {}
+    for offset, row in enumerate(rows):
+        line = start + offset + 2  # Номер строки входного файла после заголовка
+        params, inputs = read_row(row, line, distribution)
+        groups.setdefault(params.distribution, []).append((start + offset, params, inputs))
+
+    # Строки одного распределения считаются одним вызовом формул
+    for group in groups.values():
+        indexes, params_list, inputs_list = zip(*group)
+        for index, results in zip(indexes, calculate_many(params_list, inputs_list)):
+            for key, value in results.items():
+                column = RESULTS.index(key)
+                values[index, column] = value
+                computed[index, column] = True
+
+
+def _result_views(buffer, rows):
+    # Матрица значений float64 и матрица отметок «посчитано» в одном блоке памяти
+    values = np.ndarray((rows, len(RESULTS)), dtype=np.float64, buffer=buffer)
+    computed = np.ndarray((rows, len(RESULTS)), dtype=np.bool_, buffer=buffer, offset=values.nbytes)
+    return values, computed
+
+
+def _calculate_shard(memory_name, total_rows, rows, start, distribution):
+    """Расчет части строк в процессе пула с записью в общую память родителя."""
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        values, computed = _result_views(memory.buf, total_rows)
+        _calculate_into(values, computed, rows, start, distribution)
+        del values, computed  # Представления numpy держат буфер, без этого close() не сработает
+    finally:
+        memory.close()
+
+
+def calculate_results(rows, distribution=None, workers=None):
+    """Матрицы результатов (значения, отметки «посчитано») со столбцами RESULTS.
+
+    Строки делятся на части и считаются на пуле из workers процессов (по
+    умолчанию по числу ядер). Процессы пишут результаты прямо в общую память
+    multiprocessing.shared_memory, поэтому массивы результатов не пересылаются.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = len(rows) * len(RESULTS) * (np.dtype(np.float64).itemsize + np.dtype(np.bool_).itemsize)
+    if workers == 1 or len(rows) < MIN_PARALLEL_ROWS:
+        values, computed = _result_views(bytearray(size), len(rows))
+        _calculate_into(values, computed, rows, 0, distribution)
+        return values, computed
+
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        values, computed = _result_views(memory.buf, len(rows))
+        computed[:] = False
+        shard = -(-len(rows) // (workers * SHARDS_PER_WORKER))
+        # spawn: в дочерние процессы не копируется состояние родителя, как при fork
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [executor.submit(_calculate_shard, memory.name, len(rows), rows[start:start + shard],
+                                       start, distribution)
+                       for start in range(0, len(rows), shard)]
+            for future in futures:
+                future.result()  # Первая ошибка строки прерывает расчет
+        result = values.copy(), computed.copy()
+        del values, computed
+        return result
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def calculate_rows(rows, distribution=None, workers=None):
+    """Результаты для каждой строки: исходные значения строки и столбцы RESULTS.
+
+    Распределение берется из столбца distribution строки, иначе из аргумента.
+    """
+    values, computed = calculate_results(rows, distribution, workers)
+    output = []
+    for row, row_values, row_computed in zip(rows, values.tolist(), computed.tolist()):
+        results = {key: int(value) if key in INTEGER_RESULTS else value
+                   for key, value, done in zip(RESULTS, row_values, row_computed) if done}
+        output.append({**row, **results})
+    return output
+
+
+def read_rows(file_name):
+    """Строки входного файла CSV, JSON или xlsx как словари {столбец: значение}.
+
+    JSON — список объектов или объект со списком в поле rows; xlsx — первый
+    лист, первая строка — заголовки.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == ".csv":
+        with open(file_name, encoding="utf-8-sig", newline="") as file:
+            return list(csv.DictReader(file))
+    if extension == ".json":
+        with open(file_name, encoding="utf-8") as file:
+            rows = json.load(file)
+        return rows["rows"] if isinstance(rows, dict) else rows
+    if extension == ".xlsx":
+        workbook = load_workbook(file_name, read_only=True, data_only=True)
+        try:
+            values = workbook.worksheets[0].iter_rows(values_only=True)
+            headers = [str(header) for header in next(values, ())]
+            return [dict(zip(headers, row)) for row in values if any(value is not None for value in row)]
+        finally:
+            workbook.close()
+    raise ValueError(f"Неизвестный формат входного файла: {extension or file_name}")
+
+
+def _columns(rows):
+    # Входные столбцы в порядке появления, затем результаты
+    columns = list(dict.fromkeys(key for row in rows for key in row if key not in RESULTS))
+    return columns + [key for key in RESULTS if any(key in row for row in rows)]
+
+
+def write_rows(file_name, rows):
+    """Запись результатов в CSV, JSON или xlsx по расширению file_name."""
+    columns = _columns(rows)
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == ".csv":
+        with open(file_name, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    elif extension == ".json":
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump([{column: row.get(column) for column in columns} for row in rows], file,
+                      ensure_ascii=False, indent=2, default=str)
+            file.write("\n")
+    elif extension == ".xlsx":
+        data = {column: np.array([row.get(column) for row in rows], dtype=object) for column in columns}
+        export_excel(file_name, "Results", data, {})
+    else:
+        raise ValueError(f"Неизвестный формат выходного файла: {extension or file_name}")
+    return file_name
+
+
+def calculate_file(input_file, output_file, distribution=None, workers=None):
+    """Расчет по всем строкам input_file с записью в output_file; возвращает число строк."""
+    rows = calculate_rows(read_rows(input_file), distribution, workers)
+    write_rows(output_file, rows)
+    return len(rows)
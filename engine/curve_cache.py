@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from engine.grid import adaptive_grid
+
+
+# Сетка времени и все производные кривые для одного набора параметров
+Curve = namedtuple("Curve", ["time", "pdf", "cdf", "reliability", "failure_rate"])
+
+MAX_SIZE = 32
+
+# Сетка задается числом равномерных точек или ADAPTIVE
+ADAPTIVE = "adaptive"
+GRID = ADAPTIVE
+
+
+def time_grid(params, grid=GRID):
+    """Сетка времени для кривых распределения."""
+    if grid != ADAPTIVE:
+        return params.time_range(points=grid)
+
+    start, stop = params.time_range(points=2)
+    return adaptive_grid(lambda time: np.array([params.pdf(time),
+                                                params.cdf(time),
+                                                params.failure_rate(time)]),
+                         start, stop)
+
+
+def compute_curve(params, grid=GRID):
+    """Расчет сетки времени и кривых f(t), F(t), R(t), λ(t) без кэша."""
+    time = time_grid(params, grid)
+    curve = Curve(time,
+                  params.pdf(time),
+                  params.cdf(time),
+                  params.reliability(time),
+                  params.failure_rate(time))
+    # Массивы общие для всех графиков и экспорта, поэтому запрещаем их изменение
+    for values in curve:
+        values.setflags(write=False)
+    return curve
+
+
+class CurveCache:
+    """LRU-кэш кривых по ключу (объект параметров из engine.params, сетка)."""
+
+    def __init__(self, max_size=MAX_SIZE):
+        self.max_size = max_size
+        self._curves = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, params, grid=GRID):
+        key = (params, grid)
+        with self._lock:
+            curve = self._curves.get(key)
+            if curve is not None:
+                self._curves.move_to_end(key)
+                return curve
+
+        curve = compute_curve(params, grid)
+
+        with self._lock:
+            self._curves[key] = curve
+            self._curves.move_to_end(key)
+            while len(self._curves) > self.max_size:
+                self._curves.popitem(last=False)
+        return curve
+
+    def evict(self, params):
+        """Удаление кривых для параметров, которые больше не используются."""
+        with self._lock:
+            for key in [key for key in self._curves if key[0] == params]:
+                del self._curves[key]
+
+    def clear(self):
+        with self._lock:
+            self._curves.clear()
+
+    def __len__(self):
+        return len(self._curves)
+
+
+curve_cache = CurveCache()
+
+
+def get_curve(params, grid=GRID):
+    """Кривые распределения из общего кэша приложения."""
+    return curve_cache.get(params, grid)
@@ -0,0 +1,18 @@
+import engine.expon as expon
+import engine.normal as normal
+import engine.weibull as weibull
+
+
+# Непрерывные распределения: модуль с формулами и порядок его параметров
+CONTINUOUS = {
+    "normal": (normal, ("mu", "sigma")),
+    "expon": (expon, ("lambda_value",)),
+    "weibull": (weibull, ("shape_k", "scale_lambda")),
+}
+
+
+def get_continuous(distribution):
+    """Модуль распределения и имена его параметров."""
+    if distribution not in CONTINUOUS:
+        raise ValueError(f"Неизвестное распределение: {distribution}")
+    return CONTINUOUS[distribution]
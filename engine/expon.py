@@ -0,0 +1,112 @@
+import math
+
+import numpy as np
+import scipy.stats as stats
+
+import engine.settings as settings
+
+
+def _scale(lambda_value):
+    # scipy задает экспоненциальный закон через масштаб 1 / λ
+    return 1 / np.asarray(lambda_value, dtype=float)
+
+
+def _is_scalar(*values):
+    # Для одиночных чисел модуль math в десятки раз быстрее ufunc numpy
+    return all(isinstance(value, (int, float)) for value in values)
+
+
+def _closed_form(values, lambda_value):
+    # При λ ≤ 0 распределение не определено, как и в scipy возвращаем nan
+    return np.where(lambda_value > 0, values, np.nan)[()]
+
+
+def time_range(lambda_value, points=1000):
+    """Сетка времени от 0 до 99% квантиля для графиков и экспорта."""
+    return np.linspace(0, calculate_replacement_time(0.99, lambda_value), points)
+
+
+def pdf(time, lambda_value):
+    """Плотность распределения f(t)."""
+    if not settings.CLOSED_FORM:
+        return stats.expon.pdf(time, scale=_scale(lambda_value))
+    if _is_scalar(time, lambda_value):
+        if not lambda_value > 0:
+            return np.float64(np.nan)
+        return np.float64(0.0 if time < 0 else lambda_value * math.exp(-lambda_value * time))
+
+    time, lambda_value = np.asarray(time, dtype=float), np.asarray(lambda_value, dtype=float)
+    with np.errstate(over="ignore", invalid="ignore"):
+        return _closed_form(np.where(time < 0, 0.0, lambda_value * np.exp(-lambda_value * time)), lambda_value)
+
+
+def cdf(time, lambda_value):
+    """Функция распределения F(t) (вероятность отказа)."""
+    if not settings.CLOSED_FORM:
+        return stats.expon.cdf(time, scale=_scale(lambda_value))
+    if _is_scalar(time, lambda_value):
+        if not lambda_value > 0:
+            return np.float64(np.nan)
+        return np.float64(0.0 if time < 0 else -math.expm1(-lambda_value * time))
+
+    time, lambda_value = np.asarray(time, dtype=float), np.asarray(lambda_value, dtype=float)
+    with np.errstate(over="ignore", invalid="ignore"):
+        return _closed_form(np.where(time < 0, 0.0, -np.expm1(-lambda_value * time)), lambda_value)
+
+
+def reliability(time, lambda_value):
+    """Вероятность безотказной работы P(t) = 1 - F(t)."""
+    if not settings.CLOSED_FORM:
+        return stats.expon.sf(time, scale=_scale(lambda_value))
+    if _is_scalar(time, lambda_value):
+        if not lambda_value > 0:
+            return np.float64(np.nan)
+        return np.float64(1.0 if time < 0 else math.exp(-lambda_value * time))
+
+    time, lambda_value = np.asarray(time, dtype=float), np.asarray(lambda_value, dtype=float)
+    with np.errstate(over="ignore", invalid="ignore"):
+        return _closed_form(np.where(time < 0, 1.0, np.exp(-lambda_value * time)), lambda_value)
+
+
+def failure_rate(time, lambda_value):
+    """Интенсивность отказов λ(t), для экспоненциального закона постоянна."""
+    return np.zeros(np.broadcast(time, lambda_value).shape) + lambda_value
+
+
+def calculate_with_time(time, lambda_value):
+    """f(t), P(t) и 1 - P(t) для наработки t."""
+    return pdf(time, lambda_value), reliability(time, lambda_value), cdf(time, lambda_value)
+
+
+def calculate_time_for_reliability(reliability_level, lambda_value):
+    """Наработка, до которой надежность не ниже заданной."""
+    if not settings.CLOSED_FORM:
+        return stats.expon.isf(reliability_level, scale=_scale(lambda_value))
+    if _is_scalar(reliability_level, lambda_value):
+        if not (lambda_value > 0 and 0 <= reliability_level <= 1):
+            return np.float64(np.nan)
+        # При надежности 1 -log(1) дает -0.0; + 0.0 приводит его к 0.0, как в scipy
+        return np.float64(math.inf if reliability_level == 0 else -math.log(reliability_level) / lambda_value + 0.0)
+
+    level, lambda_value = np.asarray(reliability_level, dtype=float), np.asarray(lambda_value, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _closed_form(np.where((level >= 0) & (level <= 1), -np.log(level) / lambda_value + 0.0, np.nan),
+                            lambda_value)
+
+
+def calculate_replacement_time(max_failure_probability, lambda_value):
+    """Минимальная наработка до замены при заданной вероятности отказа."""
+    if not settings.CLOSED_FORM:
+        return stats.expon.ppf(max_failure_probability, scale=_scale(lambda_value))
+    if _is_scalar(max_failure_probability, lambda_value):
+        if not (lambda_value > 0 and 0 <= max_failure_probability <= 1):
+            return np.float64(np.nan)
+        if max_failure_probability == 1:
+            return np.float64(math.inf)
+        return np.float64(-math.log1p(-max_failure_probability) / lambda_value)
+
+    probability, lambda_value = np.asarray(max_failure_probability, dtype=float), np.asarray(lambda_value, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _closed_form(np.where((probability >= 0) & (probability <= 1),
+                                     -np.log1p(-probability) / lambda_value, np.nan),
+                            lambda_value)
@@ -0,0 +1,325 @@
+import csv
+import importlib.util
+import json
+import os
+import uuid
+from contextlib import contextmanager, suppress
+
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple, get_column_letter
+
+
+# Форматы экспорта: расширение и фильтр диалога сохранения
+FORMATS = {
+    ".xlsx": "Excel (*.xlsx)",
+    ".csv": "CSV (*.csv)",
+    ".parquet": "Parquet (*.parquet)",
+    ".arrow": "Arrow IPC (*.arrow)",
+    ".npz": "NumPy (*.npz)",
+}
+# Форматы, для которых нужен необязательный пакет pyarrow
+ARROW_FORMATS = (".parquet", ".arrow")
+
+# Строк таблицы, записываемых между сообщениями о ходе экспорта
+CHUNK_ROWS = 5000
+# Предел строк листа Excel; остальные строки продолжаются на следующих листах
+MAX_ROWS = 1_048_576
+# Самая длинная запись float64 в ячейке: -1.2345678901234567e-308
+FLOAT_WIDTH = 24
+# Запас ширины столбца сверх самого длинного значения
+WIDTH_PADDING = 5
+
+
+def available_formats():
+    """FORMATS без Parquet и Arrow, если пакет pyarrow не установлен."""
+    if importlib.util.find_spec("pyarrow") is not None:
+        return FORMATS
+    return {extension: name for extension, name in FORMATS.items() if extension not in ARROW_FORMATS}
+
+
+def vertical_cells(column, title, parameters):
+    """Ячейки параметров столбцом: заголовок в первой строке, ниже пары «подпись — значение»."""
+    value_column = get_column_letter(column_index_from_string(column) + 1)
+    cells = {f"{column}1": title}
+    for row, (label, value) in enumerate(parameters.items(), 2):
+        cells[f"{column}{row}"] = label
+        cells[f"{value_column}{row}"] = value
+    return cells
+
+
+def horizontal_cells(column, parameters):
+    """Ячейки параметров строкой: подписи в первой строке, значения под ними."""
+    start = column_index_from_string(column)
+    cells = {}
+    for index, (label, value) in enumerate(parameters.items(), start):
+        cells[f"{get_column_letter(index)}1"] = label
+        cells[f"{get_column_letter(index)}2"] = value
+    return cells
+
+
+def metadata(parameters):
+    """Параметры в виде строк для метаданных CSV, Parquet, Arrow и npz."""
+    return {str(label): str(value) for label, value in parameters.items()}
+
+
+@contextmanager
+def partial_file(file_name):
+    """Удаление недописанного файла, если запись прервана ошибкой или отменой."""
+    try:
+        yield
+    except BaseException:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+        raise
+
+
+@contextmanager
+def temporary_file(file_name):
+    """Временный файл рядом с file_name: после записи он заменяет file_name, при ошибке или отмене удаляется."""
+    directory, name = os.path.split(os.path.abspath(file_name))
+    # Файл создается при записи, с обычными правами, а не 0600, как у tempfile.mkstemp
+    temporary_name = os.path.join(directory, f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        yield temporary_name
+        os.replace(temporary_name, file_name)
+    except BaseException:
+        if os.path.exists(temporary_name):
+            os.remove(temporary_name)
+        raise
+
+
+@contextmanager
+def workbook_file(file_name):
+    """Книга write_only, которая по выходе из блока сохраняется в file_name.
+
+    Книга пишется во временный файл рядом с file_name (см. temporary_file). Листы
+    write_only держат строки в собственных временных файлах openpyxl, которые
+    удаляет только сохранение книги, поэтому при ошибке или отмене недописанная
+    книга тоже сохраняется во временный файл и удаляется вместе с ним.
+    """
+    workbook = Workbook(write_only=True)
+    with temporary_file(file_name) as temporary_name:
+        try:
+            yield workbook
+            workbook.save(temporary_name)
+        except BaseException:
+            # Если ошибкой было само сохранение, повторное не выполняется
+            with suppress(Exception):
+                workbook.save(temporary_name)
+            raise
+
+
+def export_table(file_name, sheet_name, data, parameters, cells, progress=None):
+    """Экспорт таблицы в формат по расширению file_name (см. FORMATS).
+
+    data — столбцы {заголовок: массив}, parameters — параметры распределения
+    {подпись: значение}. В Excel параметры пишутся в ячейки cells рядом с
+    таблицей, в остальных форматах — в метаданные файла.
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == ".xlsx":
+        return export_excel(file_name, sheet_name, data, cells, progress)
+    if extension == ".csv":
+        return export_csv(file_name, data, parameters, progress)
+    if extension == ".parquet":
+        return export_parquet(file_name, data, parameters, progress)
+    if extension == ".arrow":
+        return export_arrow(file_name, data, parameters, progress)
+    if extension == ".npz":
+        return export_npz(file_name, data, parameters, progress)
+    raise ValueError(f"Неизвестный формат экспорта: {extension or file_name}")
+
+
+def export_csv(file_name, data, parameters, progress=None):
+    """Экспорт в CSV: параметры — строки комментариев «# подпись: значение» перед заголовком.
+
+    Числа записываются блоками по CHUNK_ROWS строк через np.savetxt, float — с
+    точностью, достаточной для точного обратного чтения.
+    """
+    columns = [np.asarray(values) for values in data.values()]
+    formats = ["%d" if values.dtype.kind in "iub" else "%.17g" for values in columns]
+    rows = len(columns[0]) if columns else 0
+    chunks = range(0, rows, CHUNK_ROWS)
+
+    with partial_file(file_name), open(file_name, "w", encoding="utf-8", newline="") as file:
+        for label, value in metadata(parameters).items():
+            file.write(f"# {label}: {value}\n")
+        csv.writer(file).writerow(data)
+        for done, start in enumerate(chunks, 1):
+            block = np.column_stack([values[start:start + CHUNK_ROWS] for values in columns])
+            np.savetxt(file, block, fmt=formats, delimiter=",")
+            if progress is not None:
+                progress(done, len(chunks))
+    return file_name
+
+
+def _arrow_table(data, parameters):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise RuntimeError("Для экспорта в Parquet и Arrow нужен пакет pyarrow") from None
+    # Числовые массивы без пропусков передаются в Arrow без копирования
+    columns = {str(name): pa.array(np.asarray(values)) for name, values in data.items()}
+    return pa.table(columns, metadata=metadata(parameters))
+
+
+def export_parquet(file_name, data, parameters, progress=None):
+    """Экспорт в Parquet, параметры — в метаданных схемы (нужен pyarrow)."""
+    if progress is not None:
+        progress(0, 1)
+    table = _arrow_table(data, parameters)
+    import pyarrow.parquet as pq
+
+    with partial_file(file_name):
+        pq.write_table(table, file_name)
+    if progress is not None:
+        progress(1, 1)
+    return file_name
+
+
+def export_arrow(file_name, data, parameters, progress=None):
+    """Экспорт в файл Arrow IPC, параметры — в метаданных схемы (нужен pyarrow)."""
+    if progress is not None:
+        progress(0, 1)
+    table = _arrow_table(data, parameters)
+    import pyarrow as pa
+
+    with partial_file(file_name), pa.OSFile(file_name, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    if progress is not None:
+        progress(1, 1)
+    return file_name
+
+
+def export_npz(file_name, data, parameters, progress=None):
+    """Экспорт в несжатый .npz: по массиву на столбец и JSON параметров в __parameters__.
+
+    Массивы пишутся в файл как есть, без преобразования в таблицу.
+    """
+    if progress is not None:
+        progress(0, 1)
+    arrays = {str(name): np.asarray(values) for name, values in data.items()}
+    arrays["__parameters__"] = np.array(json.dumps(metadata(parameters), ensure_ascii=False))
+
+    with partial_file(file_name):
+        np.savez(file_name, **arrays)
+    if progress is not None:
+        progress(1, 1)
+    return file_name
+
+
+def value_width(values):
+    """Ширина самого длинного значения столбца по типу данных, без обхода ячеек."""
+    values = np.asarray(values)
+    if values.size == 0:
+        return 0
+    if values.dtype.kind in "iu":
+        return max(len(str(values.min())), len(str(values.max())))
+    if values.dtype.kind == "f":
+        return FLOAT_WIDTH
+    if values.dtype.kind == "b":
+        return len("False")
+    return max(len(str(value)) for value in values)
+
+
+def column_widths(data, cells):
+    """Ширины столбцов {номер столбца: ширина} по заголовкам, типам данных и ячейкам параметров."""
+    widths = {}
+    for column, (header, values) in enumerate(data.items(), 1):
+        widths[column] = max(len(str(header)), value_width(values))
+    for (_, column), value in cells.items():
+        if value is not None:
+            widths[column] = max(widths.get(column, 0), len(str(value)))
+    return {column: width + WIDTH_PADDING for column, width in widths.items()}
+
+
+def _row(values, cells, row):
+    # Строка таблицы, дополненная ячейками параметров этой строки справа
+    extra = {column: value for (cell_row, column), value in cells.items() if cell_row == row}
+    values = list(values) + [None] * (max(extra, default=0) - len(values))
+    for column, value in extra.items():
+        values[column - 1] = value
+    return values
+
+
+def _bold(sheet, value):
+    cell = WriteOnlyCell(sheet, value)
+    cell.font = Font(bold=True)
+    return cell
+
+
+def chunk_count(rows):
+    """Число блоков строк, о которых export_excel сообщает в progress()."""
+    per_sheet = MAX_ROWS - 1
+    return sum(len(range(start, min(start + per_sheet, rows), CHUNK_ROWS))
+               for start in range(0, max(rows, 1), per_sheet))
+
+
+def write_sheet(workbook, sheet_name, data, cells, step=None, index=None):
+    """Потоковая запись таблицы на новый лист книги write_only.
+
+    Строки сверх MAX_ROWS продолжаются на листах «<sheet_name> 2», «<sheet_name> 3», ...
+    step() вызывается после каждых CHUNK_ROWS строк. index — позиция листа в книге
+    (по умолчанию в конце).
+    """
+    headers = list(data)
+    columns = [np.asarray(values) for values in data.values()]
+    rows = len(columns[0]) if columns else 0
+    cells = {coordinate_to_tuple(cell): value for cell, value in cells.items()}
+    widths = column_widths(data, cells)
+
+    per_sheet = MAX_ROWS - 1  # Первая строка каждого листа — заголовки
+    for number, sheet_start in enumerate(range(0, max(rows, 1), per_sheet), 1):
+        sheet = workbook.create_sheet(sheet_name if number == 1 else f"{sheet_name} {number}",
+                                      index if index is None else index + number - 1)
+        sheet_cells = cells if number == 1 else {}
+        cell_rows = {cell_row for cell_row, _ in sheet_cells}
+        # В режиме write_only ширины задаются до первой строки
+        for column, width in widths.items():
+            sheet.column_dimensions[get_column_letter(column)].width = width
+
+        sheet.append([_bold(sheet, value) for value in _row(headers, sheet_cells, 1)])
+        row = 2
+        sheet_stop = min(sheet_start + per_sheet, rows)
+        for start in range(sheet_start, sheet_stop, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, sheet_stop)
+            # tolist() переводит блок в числа Python одним вызовом на столбец
+            for values in zip(*(column[start:stop].tolist() for column in columns)):
+                sheet.append(_row(values, sheet_cells, row) if row in cell_rows else values)
+                row += 1
+            if step is not None:
+                step()
+
+        # Параметры ниже короткой таблицы
+        for row in range(row, max(cell_rows, default=0) + 1):
+            sheet.append(_row([], sheet_cells, row))
+
+
+def export_excel(file_name, sheet_name, data, cells, progress=None):
+    """Потоковый экспорт таблицы в Excel.
+
+    data — столбцы {заголовок: массив}, cells — подписи и значения параметров
+    рядом с таблицей {адрес ячейки: значение}. Книга пишется в режиме write_only:
+    строки уходят во временный файл по мере записи, ширины столбцов считаются
+    по типам данных, поэтому память не растет с числом строк (см. write_sheet).
+
+    progress(done, total) вызывается после каждых CHUNK_ROWS строк; если он
+    выбросит исключение, файл не создается.
+    """
+    # Последний шаг — сохранение книги, о нем не сообщается
+    total = chunk_count(len(next(iter(data.values()), ()))) + 1
+    done = 0
+
+    def step():
+        nonlocal done
+        done += 1
+        if progress is not None:
+            progress(done, total)
+
+    with workbook_file(file_name) as workbook:
+        write_sheet(workbook, sheet_name, data, cells, step)
+    return file_name
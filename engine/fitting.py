@@ -0,0 +1,134 @@
+import os
+from decimal import Decimal
+
+import numpy as np
+
+
+# Фильтр диалога открытия файла времен отказов
+FILE_FILTER = "Времена отказов (*.csv *.txt *.npy)"
+
+# Значащих цифр в оценках, которые подставляются в поля окна
+FIT_DIGITS = 6
+# Метод Ньютона для параметра формы Вейбулла: точность и наибольшее число шагов
+TOLERANCE = 1e-12
+MAX_ITERATIONS = 100
+
+
+def read_times(file_name):
+    """Времена отказов из файла: .npy или первый столбец .csv/.txt (заголовок допускается)."""
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == ".npy":
+        return np.asarray(np.load(file_name), dtype=float).ravel()
+    if extension not in (".csv", ".txt"):
+        raise ValueError(f"Неизвестный формат файла времен отказов: {extension or file_name}")
+
+    delimiter = "," if extension == ".csv" else None
+    with open(file_name, encoding="utf-8-sig") as file:
+        first = (file.readline().split(delimiter) or [""])[0]
+    try:
+        float(first)
+        header = 0
+    except ValueError:
+        header = 1  # Первая строка — заголовок столбца
+    try:
+        return np.loadtxt(file_name, delimiter=delimiter, usecols=0, skiprows=header,
+                          ndmin=1, encoding="utf-8-sig")
+    except ValueError as error:
+        raise ValueError(f"Неверные данные в файле времен отказов: {error}") from None
+
+
+def _times(times, minimum=1):
+    times = np.asarray(times, dtype=float).ravel()
+    if times.size < minimum:
+        raise ValueError(f"Для оценки нужно не меньше {minimum} времен отказов")
+    if not np.isfinite(times).all() or (times <= 0).any():
+        raise ValueError("Времена отказов должны быть положительными числами")
+    return times
+
+
+def fit_normal(times):
+    """Оценки максимального правдоподобия (μ, σ) нормального распределения."""
+    times = _times(times, 2)
+    mu = times.mean()
+    sigma = times.std()  # Оценка максимального правдоподобия — со знаменателем n
+    if sigma == 0:
+        raise ValueError("Все времена отказов одинаковы: σ не определяется")
+    return mu, sigma
+
+
+def fit_expon(times):
+    """Оценка максимального правдоподобия λ = n / Σt экспоненциального распределения."""
+    times = _times(times)
+    return (times.size / times.sum(),)
+
+
+def fit_weibull(times, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS):
+    """Оценки максимального правдоподобия (k, λ) распределения Вейбулла.
+
+    Параметр формы k — корень уравнения правдоподобия
+    g(k) = Σ tᵏ·ln t / Σ tᵏ - 1/k - mean(ln t) = 0, который находится методом
+    Ньютона; каждый шаг — несколько операций numpy над всеми временами.
+    Затем λ = (Σ tᵏ / n)^(1/k).
+    """
+    times = _times(times, 2)
+    logs = np.log(times)
+    spread = logs.std()
+    if spread == 0:
+        raise ValueError("Все времена отказов одинаковы: параметр формы не определяется")
+
+    # tᵏ считаются относительно наибольшего времени: (t / t_max)ᵏ ≤ 1 не переполняется
+    shift = logs.max()
+    logs -= shift
+    logs_mean = logs.mean()
+    logs_squared = logs * logs
+
+    # Начальное приближение из разброса ln t: для Вейбулла σ(ln t) = π / (k·√6)
+    k = np.pi / (spread * np.sqrt(6))
+    for _ in range(max_iterations):
+        weights = np.exp(k * logs)
+        total = weights.sum()
+        mean = (weights @ logs) / total
+        g = mean - 1 / k - logs_mean
+        derivative = (weights @ logs_squared) / total - mean * mean + 1 / (k * k)
+        next_k = k - g / derivative
+        if next_k <= 0:
+            # g возрастает и вогнута, поэтому шаг справа от корня может уйти за ноль
+            next_k = k / 2
+        if abs(next_k - k) <= tolerance * next_k:
+            k = next_k
+            break
+        k = next_k
+    else:
+        raise ValueError("Метод Ньютона для параметра формы не сошелся")
+
+    scale = np.exp(shift) * np.mean(np.exp(k * logs)) ** (1 / k)
+    return k, scale
+
+
+# Распределение: функция оценки параметров в порядке полей класса параметров
+FITTERS = {
+    "normal": fit_normal,
+    "expon": fit_expon,
+    "weibull": fit_weibull,
+}
+
+
+def _decimal(value):
+    return Decimal(f"{value:.{FIT_DIGITS}g}")
+
+
+def fit(params_class, times):
+    """Объект параметров params_class с оценками максимального правдоподобия по временам отказов."""
+    if params_class.distribution not in FITTERS:
+        raise ValueError(f"Оценка параметров по данным не поддерживается: {params_class.distribution}")
+    return params_class(*(_decimal(float(value)) for value in FITTERS[params_class.distribution](times)))
+
+
+def fit_file(file_name, params_class, progress=None):
+    """Чтение времен отказов из file_name (см. read_times) и оценка параметров (см. fit)."""
+    if progress is not None:
+        progress(0, 2)
+    times = read_times(file_name)
+    if progress is not None:
+        progress(1, 2)
+    return fit(params_class, times)
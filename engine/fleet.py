@@ -0,0 +1,63 @@
+import numpy as np
+
+from engine.distributions import get_continuous
+
+
+QUANTITIES = ("pdf", "cdf", "reliability", "failure_rate")
+
+CHUNK_SIZE = 1_000_000
+
+
+def _prepare(distribution, ages, params):
+    module, names = get_continuous(distribution)
+    missing = [name for name in names if name not in params]
+    if missing:
+        raise ValueError(f"Не заданы параметры: {', '.join(missing)}")
+
+    ages = np.asarray(ages, dtype=float).ravel()
+    # Параметры задаются либо одним числом на весь парк, либо значением на каждую строку
+    args = []
+    for name in names:
+        value = np.asarray(params[name], dtype=float)
+        if value.ndim:
+            value = np.broadcast_to(value.ravel(), ages.shape)
+        args.append(value)
+    return module, ages, args
+
+
+def _evaluate_chunk(module, time, args, out):
+    out["pdf"][:] = module.pdf(time, *args)
+    out["cdf"][:] = module.cdf(time, *args)
+    out["reliability"][:] = module.reliability(time, *args)
+    # Не f(t) / R(t): далеко в хвосте оба обращаются в ноль и частное дает nan
+    out["failure_rate"][:] = module.failure_rate(time, *args)
+
+
+def iter_fleet(distribution, ages, chunk_size=CHUNK_SIZE, **params):
+    """Поблочный расчет f(t), F(t), R(t) и λ(t) с ограниченным расходом памяти.
+
+    Возвращает пары (срез строк, словарь массивов блока).
+    """
+    module, ages, args = _prepare(distribution, ages, params)
+    for start in range(0, ages.size, chunk_size):
+        rows = slice(start, min(start + chunk_size, ages.size))
+        chunk = {quantity: np.empty(rows.stop - rows.start) for quantity in QUANTITIES}
+        _evaluate_chunk(module, ages[rows], [arg[rows] if arg.ndim else arg for arg in args], chunk)
+        yield rows, chunk
+
+
+def evaluate_fleet(distribution, ages, chunk_size=CHUNK_SIZE, out=None, **params):
+    """f(t), F(t), R(t) и λ(t) для всего парка за один вызов.
+
+    ages — возраст каждой единицы, параметры распределения — числа или массивы
+    той же длины. Результат пишется в out (если передан) блоками по chunk_size строк.
+    """
+    module, ages, args = _prepare(distribution, ages, params)
+    if out is None:
+        out = {quantity: np.empty(ages.size) for quantity in QUANTITIES}
+
+    for start in range(0, ages.size, chunk_size):
+        rows = slice(start, min(start + chunk_size, ages.size))
+        chunk = {quantity: out[quantity][rows] for quantity in QUANTITIES}
+        _evaluate_chunk(module, ages[rows], [arg[rows] if arg.ndim else arg for arg in args], chunk)
+    return out
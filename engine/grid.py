@@ -0,0 +1,79 @@
+import numpy as np
+
+
+# Допустимое отклонение ломаной от кривой в долях высоты графика
+TOLERANCE = 5e-4
+# Минимальный шаг в долях диапазона, чтобы не дробить сетку у особенностей вроде λ(0) = ∞
+MIN_STEP = 1e-4
+INITIAL_POINTS = 33
+MAX_POINTS = 4000
+
+
+def _scale(values):
+    # Высота каждой кривой по конечным значениям, бесконечности (λ(0) при k < 1) не учитываются
+    finite = np.where(np.isfinite(values), values, np.nan)
+    with np.errstate(invalid="ignore"):
+        scale = np.nanmax(finite, axis=1) - np.nanmin(finite, axis=1)
+    scale[~(scale > 0)] = 1.0
+    return scale[:, np.newaxis]
+
+
+def adaptive_grid(evaluate, start, stop, tolerance=TOLERANCE, min_step=MIN_STEP,
+                  initial_points=INITIAL_POINTS, max_points=MAX_POINTS):
+    """Сетка времени, сгущающаяся там, где кривые сильно искривлены.
+
+    evaluate(time) возвращает массив значений кривых формы (число кривых, len(time)).
+    Интервал делится пополам, пока середина кривой отклоняется от хорды больше,
+    чем на tolerance от высоты графика. Интервалы короче min_step от диапазона
+    не делятся, общее число точек не превышает max_points.
+    """
+    time = np.linspace(start, stop, initial_points)
+    values = np.atleast_2d(evaluate(time))
+    min_width = (stop - start) * min_step
+    # Проверяются только интервалы, появившиеся на прошлом шаге
+    active = np.ones(time.size - 1, dtype=bool)
+
+    while active.any() and time.size < max_points:
+        left = np.flatnonzero(active)
+        middle = (time[left] + time[left + 1]) / 2
+        middle_values = np.atleast_2d(evaluate(middle))
+
+        with np.errstate(invalid="ignore"):
+            chord = (values[:, left] + values[:, left + 1]) / 2
+            error = np.abs(middle_values - chord) / _scale(values)
+        error = np.where(np.isfinite(error), error, 0.0).max(axis=0)
+
+        refine = (error > tolerance) & (time[left + 1] - time[left] > min_width)
+        if not refine.any():
+            break
+        budget = max_points - time.size
+        if refine.sum() > budget:
+            # Точек не хватает на все интервалы — уточняем самые грубые
+            refine[np.argsort(error)[:-budget]] = False
+
+        inserted = np.zeros(time.size + refine.sum(), dtype=bool)
+        time = np.concatenate([time, middle[refine]])
+        values = np.concatenate([values, middle_values[:, refine]], axis=1)
+        inserted[-refine.sum():] = True
+
+        order = np.argsort(time, kind="stable")
+        time, values, inserted = time[order], values[:, order], inserted[order]
+        active = inserted[:-1] | inserted[1:]
+
+    return time
+
+
+# Больше ступенек, чем пикселей по ширине графика, рисовать бессмысленно
+MAX_STEPS = 2000
+
+
+def coarsen_steps(k_values, values, max_steps=MAX_STEPS):
+    """Значения и границы ступенек для дискретного графика не более чем из max_steps ступенек.
+
+    Соседние k объединяются в группы, высота группы — максимум значений в ней,
+    поэтому пик распределения и уровень CDF сохраняются.
+    """
+    stride = max(1, -(-k_values.size // max_steps))
+    starts = np.arange(0, k_values.size, stride)
+    edges = np.append(k_values[starts], k_values[-1] + 1) - 0.5
+    return np.maximum.reduceat(values, starts), edges
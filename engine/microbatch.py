@@ -0,0 +1,80 @@
+import asyncio
+
+from engine.calculator import calculate_many
+
+
+# Сколько ждать попутных запросов после первого запроса пачки, с
+BATCH_DELAY = 0.002
+# Пачка такого размера считается сразу, не дожидаясь BATCH_DELAY
+MAX_BATCH = 1024
+
+
+class MicroBatcher:
+    """Сбор одновременных запросов одного распределения в один вызов calculate_many().
+
+    Первый запрос распределения открывает пачку; все запросы этого
+    распределения, пришедшие за delay секунд, считаются вместе одним вызовом
+    формул в потоке executor, чтобы цикл событий продолжал принимать запросы.
+    """
+
+    def __init__(self, delay=BATCH_DELAY, max_batch=MAX_BATCH, executor=None):
+        self.delay = delay
+        self.max_batch = max_batch
+        self.executor = executor
+        # Распределение: ожидающие запросы (параметры, входные величины, future)
+        self.pending = {}
+        self.timers = {}
+        # Ссылки на считающиеся пачки, чтобы задачи не удалил сборщик мусора
+        self._tasks = set()
+
+        # Статистика для замеров: число посчитанных запросов и пачек
+        self.requests = 0
+        self.batches = 0
+
+    async def calculate(self, params, inputs):
+        """Результаты одной строки, как calculate_many([params], [inputs])[0]."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        distribution = params.distribution
+        batch = self.pending.setdefault(distribution, [])
+        batch.append((params, inputs, future))
+
+        if len(batch) >= self.max_batch or self.delay <= 0:
+            self._flush(distribution)
+        elif distribution not in self.timers:
+            self.timers[distribution] = loop.call_later(self.delay, self._flush, distribution)
+        return await future
+
+    def _flush(self, distribution):
+        timer = self.timers.pop(distribution, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self.pending.pop(distribution, None)
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        params_list = [params for params, _, _ in batch]
+        inputs_list = [inputs for _, inputs, _ in batch]
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.executor, calculate_many, params_list, inputs_list)
+        except Exception as error:
+            if len(batch) > 1:
+                # Ошибка одной строки не должна доставаться остальным запросам пачки:
+                # строки пересчитываются по одной, и ошибку получает только ее запрос
+                await asyncio.gather(*(self._run([item]) for item in batch))
+                return
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        self.requests += len(batch)
+        self.batches += 1
+        for (_, _, future), result in zip(batch, results):
+            # Клиент мог отключиться, не дождавшись ответа
+            if not future.done():
+                future.set_result(result)
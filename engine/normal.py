@@ -0,0 +1,44 @@
+import numpy as np
+import scipy.stats as stats
+
+
+def time_range(mu, sigma, points=1000):
+    """Сетка времени μ ± 4σ для графиков и экспорта."""
+    return np.linspace(mu - 4 * sigma, mu + 4 * sigma, points)
+
+
+def pdf(time, mu, sigma):
+    """Плотность распределения f(t)."""
+    return stats.norm.pdf(time, loc=mu, scale=sigma)
+
+
+def cdf(time, mu, sigma):
+    """Функция распределения F(t)."""
+    return stats.norm.cdf(time, loc=mu, scale=sigma)
+
+
+def reliability(time, mu, sigma):
+    """Вероятность безотказной работы R(t) = 1 - F(t)."""
+    return stats.norm.sf(time, loc=mu, scale=sigma)
+
+
+def failure_rate(time, mu, sigma):
+    """Интенсивность отказов λ(t) = f(t) / R(t)."""
+    # Через логарифмы: в хвосте f(t) и R(t) уходят в ноль раньше, чем их отношение
+    with np.errstate(invalid="ignore"):
+        return np.exp(stats.norm.logpdf(time, loc=mu, scale=sigma) - stats.norm.logsf(time, loc=mu, scale=sigma))
+
+
+def calculate_with_time(time, mu, sigma):
+    """f(t), R(t) и λ(t) для времени t."""
+    return pdf(time, mu, sigma), reliability(time, mu, sigma), failure_rate(time, mu, sigma)
+
+
+def calculate_time_for_reliability(reliability_level, mu, sigma):
+    """Время, до которого надежность не ниже заданной."""
+    return stats.norm.isf(reliability_level, loc=mu, scale=sigma)
+
+
+def calculate_replacement_time(max_failure_probability, mu, sigma):
+    """Минимальное время до замены при заданной вероятности отказа."""
+    return stats.norm.ppf(max_failure_probability, loc=mu, scale=sigma)
@@ -0,0 +1,253 @@
+import math
+from dataclasses import dataclass, field, fields
+from decimal import Decimal
+
+import engine.binomial as binomial
+from engine.curve_cache import get_curve
+import engine.expon as expon
+import engine.normal as normal
+import engine.poisson as poisson
+import engine.weibull as weibull
+
+
+class ContinuousParams:
+    """Общие расчеты для неизменяемых параметров непрерывного распределения.
+
+    Значения полей хранятся как введены (Decimal), а их float-копии считаются
+    один раз при создании и передаются в формулы модуля распределения.
+    Объекты хешируются и служат ключом кэша кривых.
+    """
+
+    distribution = None
+    module = None
+    sheet_name = None  # Лист Excel при экспорте
+    # Столбцы экспорта: заголовок и поле Curve
+    export_columns = (
+        ('Время', 'time'),
+        ('Функция распределения (CDF)', 'cdf'),
+        ('Плотность распределения (PDF)', 'pdf'),
+        ('Вероятность безотказной работы', 'reliability'),
+        ('Интенсивность отказов', 'failure_rate'),
+    )
+    export_labels = ()  # Подписи параметров в экспорте: подпись и поле
+
+    def __post_init__(self):
+        object.__setattr__(self, "args", tuple(float(getattr(self, item.name))
+                                               for item in fields(self) if item.init))
+
+    def export_data(self):
+        """Столбцы таблицы экспорта и параметры распределения {подпись: значение}."""
+        # Кривые берутся из общего кэша, если графики уже строились
+        curve = get_curve(self)
+        data = {header: getattr(curve, quantity) for header, quantity in self.export_columns}
+        parameters = {label: getattr(self, name) for label, name in self.export_labels}
+        return data, parameters
+
+    def time_range(self, points=1000):
+        return self.module.time_range(*self.args, points=points)
+
+    def pdf(self, time):
+        return self.module.pdf(time, *self.args)
+
+    def cdf(self, time):
+        return self.module.cdf(time, *self.args)
+
+    def reliability(self, time):
+        return self.module.reliability(time, *self.args)
+
+    def failure_rate(self, time):
+        return self.module.failure_rate(time, *self.args)
+
+    def calculate_with_time(self, time):
+        return self.module.calculate_with_time(time, *self.args)
+
+    def calculate_time_for_reliability(self, reliability_level):
+        return self.module.calculate_time_for_reliability(reliability_level, *self.args)
+
+    def calculate_replacement_time(self, max_failure_probability):
+        return self.module.calculate_replacement_time(max_failure_probability, *self.args)
+
+
+@dataclass(frozen=True)
+class NormalParams(ContinuousParams):
+    """Параметры нормального распределения."""
+
+    distribution = "normal"
+    module = normal
+    sheet_name = "Normal Data"
+    export_labels = (
+        ('Среднее время до отказа (μ)', 'mu'),
+        ('Стандартное отклонение (σ)', 'sigma'),
+    )
+
+    mu: Decimal     # Среднее время до отказа
+    sigma: Decimal  # Стандартное отклонение
+    args: tuple = field(init=False, repr=False, compare=False)
+
+    def is_valid(self):
+        """Значения, которые допускают поля окна: μ ≥ 0, σ > 0."""
+        mu, sigma = self.args
+        return math.isfinite(mu) and math.isfinite(sigma) and mu >= 0 and sigma > 0
+
+
+@dataclass(frozen=True)
+class ExponParams(ContinuousParams):
+    """Параметры экспоненциального распределения."""
+
+    distribution = "expon"
+    module = expon
+    sheet_name = "Expon Data"
+    export_columns = ContinuousParams.export_columns[:4]
+    export_labels = (
+        ('Интенсивность отказа (λ):', 'lambda_value'),
+    )
+
+    lambda_value: Decimal  # Интенсивность отказов
+    args: tuple = field(init=False, repr=False, compare=False)
+
+    def is_valid(self):
+        """Значения, которые допускают поля окна: λ > 0."""
+        lambda_value, = self.args
+        return math.isfinite(lambda_value) and lambda_value > 0
+
+
+@dataclass(frozen=True)
+class WeibullParams(ContinuousParams):
+    """Параметры распределения Вейбулла."""
+
+    distribution = "weibull"
+    module = weibull
+    sheet_name = "Weibull Data"
+    export_labels = (
+        ('Параметр формы (k)', 'shape_k'),
+        ('Параметр масштаба (λ)', 'scale_lambda'),
+    )
+
+    shape_k: Decimal       # Параметр формы
+    scale_lambda: Decimal  # Параметр масштаба
+    args: tuple = field(init=False, repr=False, compare=False)
+
+    def is_valid(self):
+        """Значения, которые допускают поля окна: k > 0, λ > 0."""
+        shape_k, scale_lambda = self.args
+        return math.isfinite(shape_k) and math.isfinite(scale_lambda) and shape_k > 0 and scale_lambda > 0
+
+
+@dataclass(frozen=True)
+class BinomialParams:
+    """Параметры биномиального распределения."""
+
+    distribution = "binomial"
+    sheet_name = "Binomial Data"
+
+    n: int      # Количество испытаний
+    p: Decimal  # Вероятность успеха
+    args: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "args", (int(self.n), float(self.p)))
+
+    def is_valid(self):
+        """Значения, которые допускают поля окна: n ≥ 1, 0 ≤ p ≤ 1."""
+        n, p = self.args
+        return n >= 1 and 0 <= p <= 1
+
+    @property
+    def q(self):
+        return Decimal(1) - Decimal(self.p)
+
+    def pmf(self, m):
+        return binomial.pmf(m, *self.args)
+
+    def cdf(self, m):
+        return binomial.cdf(m, *self.args)
+
+    def calculate_probability_range(self, a, b):
+        return binomial.calculate_probability_range(a, b, *self.args)
+
+    def calculate_k(self):
+        return binomial.calculate_k(*self.args)
+
+    def window_table(self, tail_mass=binomial.TAIL_MASS):
+        return binomial.window_table(*self.args, tail_mass)
+
+    def table(self, tail_mass=binomial.TAIL_MASS):
+        return binomial.table(*self.args, tail_mass)
+
+    def export_data(self):
+        """Столбцы таблицы экспорта и параметры распределения {подпись: значение}."""
+        # При больших n в таблицу попадает только окно, где сосредоточена вероятность
+        m_values, pmf_values, cdf_values, tail_mass = self.table()
+        data = {
+            'm': m_values,
+            'Функция распределения (CDF)': cdf_values,
+            'Плотность распределения (PMF)': pmf_values,
+        }
+        parameters = {
+            'Размер выборки (n)': self.n,
+            'Вероятность безотказной работы (p)': self.p,
+            'Вероятность отказа (q)': self.q,
+            'Вероятность вне таблицы': tail_mass,
+        }
+        return data, parameters
+
+
+@dataclass(frozen=True)
+class PoissonParams:
+    """Параметры распределения Пуассона."""
+
+    distribution = "poisson"
+    sheet_name = "Poisson Data"
+
+    n: int                 # Количество испытаний
+    lambda_value: Decimal  # λ = n·p
+    args: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "args", (int(self.n), float(self.lambda_value)))
+
+    def is_valid(self):
+        """Значения, которые допускают поля окна: n ≥ 1, λ = n·p при 0 ≤ p ≤ 1."""
+        n, lambda_value = self.args
+        return n >= 1 and 0 <= lambda_value <= n
+
+    @property
+    def p(self):
+        return Decimal(self.lambda_value) / Decimal(self.n)
+
+    @property
+    def q(self):
+        return Decimal(1) - self.p
+
+    def pmf(self, k):
+        return poisson.pmf(k, self.args[1])
+
+    def cdf(self, k):
+        return poisson.cdf(k, self.args[1])
+
+    def calculate_k(self):
+        return poisson.calculate_k(*self.args)
+
+    def window_table(self, tail_mass=poisson.TAIL_MASS):
+        return poisson.window_table(*self.args, tail_mass)
+
+    def table(self, tail_mass=poisson.TAIL_MASS):
+        return poisson.table(*self.args, tail_mass)
+
+    def export_data(self):
+        """Столбцы таблицы экспорта и параметры распределения {подпись: значение}."""
+        # Таблица строится рекуррентно от моды, при больших n — только в окне около λ
+        k_values, pmf_values, cdf_values, tail_mass = self.table()
+        data = {
+            'm': k_values,
+            'Функция распределения (CDF)': cdf_values,
+            'Плотность распределения (PMF)': pmf_values,
+        }
+        parameters = {
+            'Размер выборки (n)': self.n,
+            'Интенсивность отказов (λ)': self.lambda_value,
+            'Вероятность безотказной работы (p)': self.p,
+            'Вероятность отказа (q)': self.q,
+            'Вероятность вне таблицы': tail_mass,
+        }
+        return data, parameters
@@ -0,0 +1,111 @@
+import numpy as np
+import scipy.stats as stats
+
+
+# Начиная с этого n таблицы строятся только по окну, где сосредоточена вероятность
+LARGE_N = 100_000
+# Допустимая суммарная вероятность отброшенных хвостов
+TAIL_MASS = 1e-12
+
+
+def calculate_lambda(n, p):
+    """Параметр распределения Пуассона λ = n·p."""
+    return np.multiply(n, p)
+
+
+def pmf(k, lambda_value):
+    """Вероятность появления события k раз P(X = k)."""
+    return stats.poisson.pmf(k, lambda_value)
+
+
+def cdf(k, lambda_value):
+    """Вероятность появления события не более k раз P(X ≤ k)."""
+    return stats.poisson.cdf(k, lambda_value)
+
+
+def calculate_k(n, lambda_value):
+    """Наиболее вероятное число событий (мода) ⌊λ⌋, не больше n."""
+    return np.minimum(np.floor(np.asarray(lambda_value, dtype=float)), n).astype(np.int64)[()]
+
+
+def support(n, lambda_value, tail_mass=TAIL_MASS):
+    """Окно [a, b] вокруг λ ± c·√λ в пределах 0..n и вероятность вне него.
+
+    Вероятность k > n окно покрыть не может, поэтому она не участвует в выборе
+    окна, но входит в возвращаемую вероятность вне окна.
+    """
+    deviation = np.sqrt(lambda_value)
+    c = stats.norm.isf(tail_mass / 2) + 1
+    above = stats.poisson.sf(n, lambda_value)
+    while True:
+        a = int(max(0, np.floor(lambda_value - c * deviation) - 1))
+        b = int(min(n, np.ceil(lambda_value + c * deviation) + 1))
+        tail = ((cdf(a - 1, lambda_value) if a > 0 else 0.0)
+                + (stats.poisson.sf(b, lambda_value) - above if b < n else 0.0))
+        # Правый хвост Пуассона тяжелее нормального — при необходимости расширяем окно
+        if tail <= tail_mass or (a == 0 and b == n):
+            return a, b, tail + above
+        c *= 1.5
+
+
+def _stirling_error(k):
+    # ln k! - ((k + 1/2)·ln k - k + ln √(2π)) для k > 15 по асимптотическому ряду
+    k2 = k * k
+    return (1 / 12 - (1 / 360 - (1 / 1260 - (1 / 1680 - 1 / (1188 * k2)) / k2) / k2) / k2) / k
+
+
+def _deviance(k, lambda_value):
+    # k·ln(k / λ) + λ - k без потери точности при k ≈ λ
+    if abs(k - lambda_value) >= 0.1 * (k + lambda_value):
+        return k * np.log(k / lambda_value) + lambda_value - k
+    v = (k - lambda_value) / (k + lambda_value)
+    total = (k - lambda_value) * v
+    term = 2 * k * v
+    j = 1
+    while True:
+        term *= v * v
+        previous, total = total, total + term / (2 * j + 1)
+        if total == previous:
+            return total
+        j += 1
+
+
+def _mode_pmf(k, lambda_value):
+    # При больших λ логарифмическая формула scipy теряет до 1e-6 относительной точности,
+    # поэтому опорное значение считается по формуле Лоадера
+    if k <= 15:
+        return pmf(k, lambda_value)
+    return np.exp(-_stirling_error(k) - _deviance(k, lambda_value)) / np.sqrt(2 * np.pi * k)
+
+
+def pmf_window(lambda_value, a, b):
+    """PMF на отрезке [a, b] по рекуррентной формуле p(k + 1) = p(k)·λ / (k + 1) от моды."""
+    mode = min(max(int(np.floor(lambda_value)), a), b)
+    center = _mode_pmf(mode, lambda_value)
+    # p(mode + 1), ..., p(b)
+    upper = center * np.cumprod(lambda_value / np.arange(mode + 1, b + 1))
+    # p(mode - 1), ..., p(a): p(k - 1) = p(k)·k / λ
+    lower = center * np.cumprod(np.arange(mode, a, -1) / lambda_value)
+    return np.concatenate([lower[::-1], [center], upper])
+
+
+def _table(lambda_value, a, b, tail):
+    k_values = np.arange(a, b + 1)
+    pmf_values = pmf_window(lambda_value, a, b)
+    cdf_values = (cdf(a - 1, lambda_value) if a > 0 else 0.0) + np.cumsum(pmf_values)
+    return k_values, pmf_values, np.minimum(cdf_values, 1.0), tail
+
+
+def window_table(n, lambda_value, tail_mass=TAIL_MASS):
+    """Значения k, PMF и CDF только в окне support() и вероятность вне окна."""
+    return _table(lambda_value, *support(n, lambda_value, tail_mass))
+
+
+def table(n, lambda_value, tail_mass=TAIL_MASS):
+    """Значения k, PMF и CDF и вероятность вне таблицы.
+
+    При n < LARGE_N таблица строится для всех k от 0 до n, иначе — только для окна support().
+    """
+    if n >= LARGE_N:
+        return window_table(n, lambda_value, tail_mass)
+    return _table(lambda_value, 0, n, stats.poisson.sf(n, lambda_value))
@@ -0,0 +1,3 @@
+# Явные формулы для экспоненциального распределения и распределения Вейбулла
+# работают на порядок быстрее scipy.stats. False — считать всё через scipy.
+CLOSED_FORM = True
@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+import scipy.stats as stats
+
+import engine.settings as settings
+
+
+def _is_scalar(*values):
+    # Для одиночных чисел модуль math в десятки раз быстрее ufunc numpy
+    return all(isinstance(value, (int, float)) for value in values)
+
+
+def _valid(shape_k, scale_lambda):
+    return shape_k > 0 and scale_lambda > 0
+
+
+def _closed_form(values, shape_k, scale_lambda):
+    # При неположительных параметрах распределение не определено, как и в scipy возвращаем nan
+    return np.where((shape_k > 0) & (scale_lambda > 0), values, np.nan)[()]
+
+
+def _arrays(*values):
+    return [np.asarray(value, dtype=float) for value in values]
+
+
+def _cumulative_hazard(time, shape_k, scale_lambda):
+    # H(t) = (t / a)^k, при t < 0 равна нулю
+    return np.power(np.maximum(time, 0.0) / scale_lambda, shape_k)
+
+
+def _hazard(time, shape_k, scale_lambda):
+    # λ(t) = k / a · (t / a)^(k - 1)
+    return shape_k / scale_lambda * np.power(time / scale_lambda, shape_k - 1)
+
+
+def _scalar_power(base, exponent):
+    # Степень float при переполнении дает исключение, а не бесконечность, как в numpy
+    try:
+        return base ** exponent
+    except OverflowError:
+        return math.inf
+
+
+def _scalar_hazard(time, shape_k, scale_lambda):
+    if time == 0:
+        # 0 в отрицательной степени в math дает исключение, а не бесконечность
+        return math.inf if shape_k < 1 else (1 / scale_lambda if shape_k == 1 else 0.0)
+    return shape_k / scale_lambda * _scalar_power(time / scale_lambda, shape_k - 1)
+
+
+def time_range(shape_k, scale_lambda, points=1000):
+    """Сетка времени от 0 до 99% квантиля для графиков и экспорта."""
+    return np.linspace(0, calculate_replacement_time(0.99, shape_k, scale_lambda), points)
+
+
+def pdf(time, shape_k, scale_lambda):
+    """Плотность распределения f(t)."""
+    if not settings.CLOSED_FORM:
+        return stats.weibull_min.pdf(time, c=shape_k, scale=scale_lambda)
+    if _is_scalar(time, shape_k, scale_lambda):
+        if not _valid(shape_k, scale_lambda):
+            return np.float64(np.nan)
+        if time < 0:
+            return np.float64(0.0)
+        survival = math.exp(-_scalar_power(time / scale_lambda, shape_k))
+        # Когда R(t) уходит в ноль, λ(t) может переполниться, и произведение ∞ · 0 дало бы nan
+        if survival == 0:
+            return np.float64(0.0)
+        return np.float64(_scalar_hazard(time, shape_k, scale_lambda) * survival)
+
+    time, shape_k, scale_lambda = _arrays(time, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        survival = np.exp(-_cumulative_hazard(time, shape_k, scale_lambda))
+        values = _hazard(time, shape_k, scale_lambda) * survival
+        return _closed_form(np.where((time < 0) | (survival == 0), 0.0, values), shape_k, scale_lambda)
+
+
+def cdf(time, shape_k, scale_lambda):
+    """Функция распределения F(t)."""
+    if not settings.CLOSED_FORM:
+        return stats.weibull_min.cdf(time, c=shape_k, scale=scale_lambda)
+    if _is_scalar(time, shape_k, scale_lambda):
+        if not _valid(shape_k, scale_lambda):
+            return np.float64(np.nan)
+        return np.float64(0.0 if time < 0 else -math.expm1(-_scalar_power(time / scale_lambda, shape_k)))
+
+    time, shape_k, scale_lambda = _arrays(time, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = -np.expm1(-_cumulative_hazard(time, shape_k, scale_lambda))
+        return _closed_form(values, shape_k, scale_lambda)
+
+
+def reliability(time, shape_k, scale_lambda):
+    """Вероятность безотказной работы R(t) = 1 - F(t)."""
+    if not settings.CLOSED_FORM:
+        return stats.weibull_min.sf(time, c=shape_k, scale=scale_lambda)
+    if _is_scalar(time, shape_k, scale_lambda):
+        if not _valid(shape_k, scale_lambda):
+            return np.float64(np.nan)
+        return np.float64(1.0 if time < 0 else math.exp(-_scalar_power(time / scale_lambda, shape_k)))
+
+    time, shape_k, scale_lambda = _arrays(time, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = np.exp(-_cumulative_hazard(time, shape_k, scale_lambda))
+        return _closed_form(values, shape_k, scale_lambda)
+
+
+def failure_rate(time, shape_k, scale_lambda):
+    """Интенсивность отказов λ(t) = f(t) / R(t)."""
+    if not settings.CLOSED_FORM:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return pdf(time, shape_k, scale_lambda) / reliability(time, shape_k, scale_lambda)
+    if _is_scalar(time, shape_k, scale_lambda):
+        if not _valid(shape_k, scale_lambda):
+            return np.float64(np.nan)
+        return np.float64(0.0 if time < 0 else _scalar_hazard(time, shape_k, scale_lambda))
+
+    time, shape_k, scale_lambda = _arrays(time, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = np.where(time < 0, 0.0, _hazard(time, shape_k, scale_lambda))
+        return _closed_form(values, shape_k, scale_lambda)
+
+
+def calculate_with_time(time, shape_k, scale_lambda):
+    """f(t), R(t) и λ(t) для времени t."""
+    # λ(t) считается напрямую: f(t) / R(t) дает 0 / 0, когда обе величины уходят в ноль
+    return (pdf(time, shape_k, scale_lambda), reliability(time, shape_k, scale_lambda),
+            failure_rate(time, shape_k, scale_lambda))
+
+
+def calculate_time_for_reliability(reliability_level, shape_k, scale_lambda):
+    """Время, до которого надежность не ниже заданной."""
+    if not settings.CLOSED_FORM:
+        return stats.weibull_min.isf(reliability_level, c=shape_k, scale=scale_lambda)
+    if _is_scalar(reliability_level, shape_k, scale_lambda):
+        if not (_valid(shape_k, scale_lambda) and 0 <= reliability_level <= 1):
+            return np.float64(np.nan)
+        if reliability_level == 0:
+            return np.float64(math.inf)
+        return np.float64(scale_lambda * _scalar_power(-math.log(reliability_level), 1 / shape_k))
+
+    level, shape_k, scale_lambda = _arrays(reliability_level, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = scale_lambda * np.power(-np.log(level), 1 / shape_k)
+        return _closed_form(np.where((level >= 0) & (level <= 1), values, np.nan), shape_k, scale_lambda)
+
+
+def calculate_replacement_time(max_failure_probability, shape_k, scale_lambda):
+    """Минимальное время до замены при заданной вероятности отказа."""
+    if not settings.CLOSED_FORM:
+        return stats.weibull_min.ppf(max_failure_probability, c=shape_k, scale=scale_lambda)
+    if _is_scalar(max_failure_probability, shape_k, scale_lambda):
+        if not (_valid(shape_k, scale_lambda) and 0 <= max_failure_probability <= 1):
+            return np.float64(np.nan)
+        if max_failure_probability == 1:
+            return np.float64(math.inf)
+        return np.float64(scale_lambda * _scalar_power(-math.log1p(-max_failure_probability), 1 / shape_k))
+
+    probability, shape_k, scale_lambda = _arrays(max_failure_probability, shape_k, scale_lambda)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = scale_lambda * np.power(-np.log1p(-probability), 1 / shape_k)
+        return _closed_form(np.where((probability >= 0) & (probability <= 1), values, np.nan),
+                            shape_k, scale_lambda)
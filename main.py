@@ -1,11 +1,17 @@
+import multiprocessing
 import sys
 from PyQt6.QtWidgets import QApplication
 
 from main_window import MainWindow
+from windows.theme import apply_theme
 
 # Основной Python код
 if __name__ == "__main__":
+    # Процессы пакетного экспорта в собранном PyInstaller приложении
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
+    apply_theme(app)
 
     window = MainWindow()
     window.show()
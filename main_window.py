@@ -1,15 +1,27 @@
-from PyQt6.QtCore import Qt
+import importlib
+import threading
+
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QGridLayout,
 )
 
 from windows.base_list_view import BaseListView
-from windows.binomial.binomial_window import BinomialWindow
-from windows.expon.expon_window import ExponWindow
-from windows.normal.normal_window import NormalWindow
-from windows.poisson.poisson_window import PoissonWindow
-from windows.weibull.weibull_window import WeibullWindow
+
+
+# Окна распределений в порядке списка: модуль и класс окна.
+# Модуль (а с ним scipy, openpyxl и matplotlib) загружается при первом открытии окна
+DISTRIBUTION_WINDOWS = [
+    ("windows.poisson.poisson_window", "PoissonWindow"),
+    ("windows.binomial.binomial_window", "BinomialWindow"),
+    ("windows.normal.normal_window", "NormalWindow"),
+    ("windows.expon.expon_window", "ExponWindow"),
+    ("windows.weibull.weibull_window", "WeibullWindow"),
+]
+
+# Загружать ли модули окон в фоне после первой отрисовки главного окна
+PREWARM = True
 
 
 class MainWindow(QMainWindow):
@@ -17,14 +29,10 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
 
         self.setWindowTitle("Distribution")
-        self.setStyleSheet('''
-                MainWindow {
-                    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #e83a00,
-                        stop:1 #005ce8);
-                }''')
         self.resize(800, 600)
 
+        self._prewarm_started = False
+
         self.setCentralWidget(QWidget(self))
 
         # Основная сетка
@@ -57,22 +65,36 @@ class MainWindow(QMainWindow):
         self.distribution_list.doubleClicked.connect(self.open_distribution_window)
 
 
+    def showEvent(self, a0):
+        super().showEvent(a0)
+        if PREWARM and not self._prewarm_started:
+            self._prewarm_started = True
+            # Таймер срабатывает после обработки событий отрисовки, список уже на экране
+            QTimer.singleShot(0, self.prewarm)
+
+    def prewarm(self):
+        """Фоновый импорт модулей окон, чтобы первое открытие окна не ждало scipy и matplotlib."""
+        thread = threading.Thread(target=self._import_windows, name="prewarm", daemon=True)
+        thread.start()
+
+    @staticmethod
+    def _import_windows():
+        for module_name, _ in DISTRIBUTION_WINDOWS:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                # Ошибка импорта повторится и будет показана при открытии окна
+                return
+
     def open_distribution_window(self, index):
-        # Получение текста выбранного элемента
+        # Получение номера выбранного элемента
         distribution_id = self.distribution_model.itemFromIndex(index).row()
+        if not 0 <= distribution_id < len(DISTRIBUTION_WINDOWS):
+            return
 
-        match distribution_id:
-            case 0:
-                window = PoissonWindow()
-            case 1:
-                window = BinomialWindow()
-            case 2:
-                window = NormalWindow()
-            case 3:
-                window = ExponWindow()
-            case 4:
-                window = WeibullWindow()
-            case _:
-                return
+        module_name, class_name = DISTRIBUTION_WINDOWS[distribution_id]
+        window_class = getattr(importlib.import_module(module_name), class_name)
+
+        window = window_class()
         window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         window.show()
@@ -0,0 +1,166 @@
+"""Локальный HTTP/JSON-сервис расчетов без графического интерфейса.
+
+    python service.py [--host 127.0.0.1] [--port 8765] [--delay 2] [--max-batch 1024]
+
+POST /calculate — тело: объект JSON со столбцами строки, как во входном файле
+batch.py calculate (distribution, параметры распределения и входные
+величины), или список таких объектов. Ответ — объект (список объектов) с
+результатами: f_t, cdf_t, reliability, failure_rate, time_for_reliability,
+replacement_time, lambda_np, k, pmf, cdf, probability_range. Неопределенные и
+бесконечные значения возвращаются как null.
+
+    curl -d '{"distribution": "weibull", "shape_k": 1.5, "scale_lambda": 1000,
+              "max_failure_probability": 0.1}' http://127.0.0.1:8765/calculate
+
+Одновременные запросы одного распределения собираются в пачки и считаются
+одним вызовом формул (см. engine.microbatch). Ошибка в параметрах — ответ
+400 с полем error.
+
+GET /stats — число посчитанных запросов и пачек (для benchmarks/service.py).
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+
+from engine.calculator import read_row
+from engine.microbatch import BATCH_DELAY, MAX_BATCH, MicroBatcher
+
+
+# Наибольший размер тела запроса, байт
+MAX_BODY = 1 << 20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+def _json_value(value):
+    # JSON не допускает NaN и бесконечностей
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class Service:
+    """Обработка HTTP/1.1 с keep-alive поверх asyncio.start_server."""
+
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    async def calculate(self, row, line=1):
+        if not isinstance(row, dict):
+            raise ValueError(f"Строка {line}: ожидается объект JSON")
+        params, inputs = read_row(row, line)
+        results = await self.batcher.calculate(params, inputs)
+        return {key: _json_value(value) for key, value in results.items()}
+
+    async def handle_body(self, body):
+        try:
+            request = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as error:
+            raise ValueError(f"Неверный JSON: {error}") from None
+        if isinstance(request, list):
+            return await asyncio.gather(*(self.calculate(row, line) for line, row in enumerate(request, 1)))
+        return await self.calculate(request)
+
+    async def respond(self, method, path, body):
+        path = path.split("?")[0]
+        if path == "/stats" and method == "GET":
+            return 200, {"requests": self.batcher.requests, "batches": self.batcher.batches}
+        if path != "/calculate":
+            return 404, {"error": f"Нет ресурса {path}"}
+        if method != "POST":
+            return 405, {"error": "Ожидается POST"}
+        try:
+            return 200, await self.handle_body(body)
+        except ValueError as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path, version = (request_line.split(" ", 2) + ["", ""])[:3]
+                headers = {}
+                for header in header_lines:
+                    name, _, value = header.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                length = headers.get("content-length") or "0"
+                if not length.isdigit():
+                    await self.send(writer, 400, {"error": "Неверный Content-Length"}, False)
+                    return
+                length = int(length)
+                if length > MAX_BODY:
+                    await self.send(writer, 413, {"error": f"Тело запроса больше {MAX_BODY} байт"}, False)
+                    return
+                body = await reader.readexactly(length)
+
+                # HTTP/1.1 держит соединение открытым, если клиент не просил закрыть
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version.upper() == "HTTP/1.1")
+                status, payload = await self.respond(method.upper(), path, body)
+                await self.send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def send(writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(host, port, delay=BATCH_DELAY, max_batch=MAX_BATCH):
+    service = Service(MicroBatcher(delay, max_batch))
+    server = await asyncio.start_server(service.handle, host, port)
+    # Номер порта печатается и при --port 0, когда его выбирает система
+    port = server.sockets[0].getsockname()[1]
+    print(f"Сервис расчетов: http://{host}:{port}/calculate", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Локальный HTTP/JSON-сервис расчетов надежности")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес (по умолчанию только локальный)")
+    parser.add_argument("--port", type=int, default=8765, help="порт; 0 — выбрать свободный")
+    parser.add_argument("--delay", type=float, default=BATCH_DELAY * 1000,
+                        help="ожидание попутных запросов пачки, мс; 0 — без пачек")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="наибольший размер пачки")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.delay / 1000, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    except OSError as error:
+        print(f"Ошибка: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,40 +6,16 @@ class BaseLineEdit(QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.setStyleSheet("""
-            BaseLineEdit {
-                border: 1px solid white;
-                border-radius: 10px;
-                padding: 0 8px;
-                background: rgba(255, 255, 255, 0);
-                selection-background-color: rgba(255, 255, 255, 0.5);
-                color: white;
-            }
-            
-            BaseLineEdit::placeholder {
-                color: rgba(255, 255, 255, 0.5); /* Установить красный цвет с прозрачностью */
-            }
-            
-            BaseLineEdit::read-only {
-                border: 1px solid rgba(255, 255, 255, 0.5);
-            }
-        """)
-
-    def change_color(self, color: str):
-        self.setStyleSheet(f"""
-            BaseLineEdit {{
-                border: 1px solid white;
-                border-radius: 10px;
-                padding: 0 8px;
-                background: rgba(255, 255, 255, 0);
-                selection-background-color: rgba(255, 255, 255, 0.5);
-                color: {color};
-            }}
-            
-            BaseLineEdit::placeholder {{
-                color: rgba(255, 255, 255, 0.5); /* Установить красный цвет с прозрачностью */
-            }}
-        """)
+        # Результат последней проверки ввода, от него зависит цвет текста
+        self.setProperty("invalid", False)
+
+    def set_invalid(self, invalid: bool):
+        # Стиль пересчитывается только при смене состояния, а не на каждое нажатие клавиши
+        if self.property("invalid") == invalid:
+            return
+        self.setProperty("invalid", invalid)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 
 class FocusOutLineEdit(BaseLineEdit):
@@ -0,0 +1,347 @@
+import os
+
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+from PyQt6.QtGui import QPainter, QImage
+from PyQt6.QtWidgets import QApplication, QFileDialog
+
+from engine.curve_cache import get_curve
+from engine.grid import coarsen_steps
+from windows.base_button import BaseButton
+from windows.base_window import BaseWindow
+
+
+# Прежние пределы осей сохраняются, пока данные занимают не меньше этой доли видимой области
+MIN_FILL = 0.5
+
+
+def _fits(low, high, limits):
+    view_low, view_high = sorted(limits)
+    return view_low <= low and high <= view_high and high - low >= MIN_FILL * (view_high - view_low)
+
+
+def _curve_limits(time, values):
+    finite = values[np.isfinite(values)]
+    return time[0], time[-1], finite.min(), finite.max()
+
+
+def _set_finite_ylim(ax, values):
+    ax.set_ylim(0, max(values[~np.isinf(values)]))  # Исключить бесконечности
+
+
+class BasePlot(BaseWindow):
+    """Окно графика распределения.
+
+    Фигура, холст и артисты создаются один раз. При новых параметрах
+    set_params обновляет данные артистов. Если пределы осей и заголовок не
+    изменились, перерисовываются только артисты данных поверх сохраненного фона
+    (blitting), иначе холст перерисовывается целиком.
+    """
+
+    window_title = ""
+
+    def __init__(self, params):
+        super().__init__()
+
+        self.setWindowTitle(self.window_title)
+        self.setGeometry(100, 100, 800, 600)
+
+        # Создаем фигуру для графика
+        self.figure = Figure(figsize=(8, 6), dpi=100)
+        self.create_axes()
+        self.canvas = FigureCanvasQTAgg(self.figure)
+
+        # Добавляем холст в макет
+        self.layout().addWidget(self.canvas)
+
+        # Кнопки для сохранения и копирования графика
+        self.save_button = BaseButton("Сохранить график")
+        self.copy_button = BaseButton("Копировать график")
+        self.save_button.clicked.connect(self.save_plot)
+        self.copy_button.clicked.connect(self.copy_plot)
+
+        self.layout().addWidget(self.save_button)
+        self.layout().addWidget(self.copy_button)
+
+        # Фон осей без артистов данных, снимается после каждой полной перерисовки
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        # Идет сохранение в файл: его перерисовка не относится к экрану
+        self.saving = False
+
+        self.params = None
+        self.set_params(params)
+
+    def set_params(self, params):
+        """Обновление графика для новых параметров."""
+        if params == self.params:
+            return
+        first = self.params is None
+        self.params = params
+        title = self.ax.get_title()
+        self.update_plot(params)
+
+        if first:
+            # Обновляем холст, чтобы отобразить график
+            self.canvas.draw()
+        elif self.rescale() or self.ax.get_title() != title or self.background is None:
+            # Перерисовка откладывается до возврата в цикл событий и объединяется с другими
+            self.canvas.draw_idle()
+        else:
+            self.blit()
+
+    def create_axes(self):
+        """Создание осей; self.ax — оси, по заголовку которых отслеживается полная перерисовка."""
+        self.ax = self.figure.add_subplot(111)
+
+    def update_plot(self, params):
+        """Создание артистов при первом вызове и обновление их данных при следующих.
+
+        Артисты данных создаются с set_animated(True): полная перерисовка
+        их пропускает, и они рисуются отдельно поверх фона. Без переопределения
+        окно показывает пустые оси.
+        """
+
+    def live_artists(self):
+        """Артисты, которые меняются вместе с параметрами: анимированные артисты фигуры."""
+        return [artist for ax in self.figure.axes for artist in ax.get_children() if artist.get_animated()]
+
+    def data_limits(self):
+        """Границы данных (x0, x1, y0, y1), которые должны помещаться в видимую область.
+
+        По умолчанию — границы всех артистов осей self.ax.
+        """
+        self.ax.relim()
+        (x0, y0), (x1, y1) = self.ax.dataLim.get_points()
+        return x0, x1, y0, y1
+
+    def rescale(self):
+        """Подгонка осей под новые данные; False, если прежние пределы подходят."""
+        x0, x1, y0, y1 = self.data_limits()
+        if _fits(x0, x1, self.ax.get_xlim()) and _fits(y0, y1, self.ax.get_ylim()):
+            return False
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return True
+
+    def blit_bbox(self):
+        """Область холста, в которой лежат артисты данных."""
+        return self.ax.bbox
+
+    def on_draw(self, event):
+        # savefig тоже вызывает draw_event, в том числе на холсте PDF или SVG
+        if event.canvas is not self.canvas or self.saving:
+            return
+        self.background = self.canvas.copy_from_bbox(self.blit_bbox())
+        for artist in self.live_artists():
+            artist.axes.draw_artist(artist)
+
+    def blit(self):
+        """Перерисовка только артистов данных поверх сохраненного фона."""
+        self.canvas.restore_region(self.background)
+        for artist in self.live_artists():
+            artist.axes.draw_artist(artist)
+        self.canvas.blit(self.blit_bbox())
+
+    def save_figure(self, file_name, format=None):
+        """Сохранение фигуры в файл вместе с артистами данных."""
+        artists = self.live_artists()
+        self.saving = True
+        try:
+            # Анимированные артисты полная перерисовка пропускает, в файл они идут как обычные
+            for artist in artists:
+                artist.set_animated(False)
+            self.figure.savefig(file_name, format=format)
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
+            self.saving = False
+            # Сохранение в PNG и JPG рисует в буфер холста: фон снимается заново при полной перерисовке
+            self.background = None
+            self.canvas.draw_idle()
+
+    def save_plot(self):
+        """Сохранение графика в файл."""
+        file_name, ext = QFileDialog.getSaveFileName(self, "Сохранить график", "",
+                                                "PNG файлы (*.png);;JPEG файлы (*.jpg);;PDF файлы (*.pdf);; SVG файлы (*.svg)")
+
+        if file_name:
+            _, file_extension = os.path.splitext(file_name)
+
+            # Определяем формат на основе расширения файла
+            if ext.lower().endswith(".png)"):
+                if not file_extension:
+                    file_name += ".png"
+                self.save_figure(file_name, "png")
+            elif ext.lower().endswith(".jpg)"):
+                if not file_extension:
+                    file_name += ".jpg"
+                self.save_figure(file_name, "jpg")
+            elif ext.lower().endswith(".pdf)"):
+                if not file_extension:
+                    file_name += ".pdf"
+                self.save_figure(file_name, "pdf")
+            elif ext.lower().endswith(".svg)"):
+                if not file_extension:
+                    file_name += ".svg"
+                self.save_figure(file_name, "svg")
+            else:
+                self.save_figure(file_name)
+
+    def copy_plot(self):
+        """Копирование графика в буфер обмена."""
+        # Создаем изображение из графика с тем же размером
+        width, height = self.canvas.width(), self.canvas.height()
+        image = QImage(width, height, QImage.Format.Format_ARGB32)
+
+        # Рисуем на изображении с помощью QPainter
+        painter = QPainter(image)
+        self.canvas.render(painter)
+        painter.end()
+
+        # Копируем изображение в буфер обмена
+        clipboard = QApplication.clipboard()
+        clipboard.setImage(image)
+
+
+class CurvePlot(BasePlot):
+    """График одной кривой непрерывного распределения из кэша кривых."""
+
+    quantity = ""  # Поле Curve: pdf, cdf, reliability или failure_rate
+    label = ""
+    color = None
+    title = ""
+    xlabel = ""
+    ylabel = ""
+    # Ограничить ось y конечными значениями (λ(t) может уходить в бесконечность)
+    finite_ylim = False
+
+    line = None
+
+    def update_plot(self, params):
+        curve = get_curve(params)
+        self.time = curve.time
+        self.values = getattr(curve, self.quantity)
+
+        if self.line is None:
+            self.line, = self.ax.plot(self.time, self.values, label=self.label, color=self.color,
+                                      animated=True)
+            self.ax.set_title(self.title)
+            self.ax.set_xlabel(self.xlabel)
+            self.ax.set_ylabel(self.ylabel)
+            self.ax.grid()
+            self.ax.legend()
+            self.set_finite_ylim()
+        else:
+            self.line.set_data(self.time, self.values)
+
+    def set_finite_ylim(self):
+        if self.finite_ylim:
+            _set_finite_ylim(self.ax, self.values)
+
+    def live_artists(self):
+        return [self.line]
+
+    def data_limits(self):
+        return _curve_limits(self.time, self.values)
+
+    def rescale(self):
+        if not super().rescale():
+            return False
+        self.set_finite_ylim()
+        return True
+
+
+class StepPlot(BasePlot):
+    """Ступенчатый график дискретного распределения.
+
+    Рисуется только окно, где сосредоточено 1 - 1e-12 вероятности, одним артистом.
+    """
+
+    quantity = ""  # pmf или cdf
+    title = ""  # Шаблон заголовка, подставляются поля params: "(n={params.n})"
+
+    steps = None
+
+    def update_plot(self, params):
+        self.k_values, pmf_values, cdf_values, self.tail_mass = params.window_table()
+        self.values = pmf_values if self.quantity == "pmf" else cdf_values
+
+        if self.steps is None:
+            self.steps = self.ax.stairs(*coarsen_steps(self.k_values, self.values), fill=True,
+                                        color="blue", alpha=0.7, label="Теоретическое распределение",
+                                        animated=True)
+            self.ax.set_xlabel("Количество событий")
+            self.ax.set_ylabel("Вероятность")
+        else:
+            self.steps.set_data(*coarsen_steps(self.k_values, self.values))
+
+        self.ax.set_title(self.title.format(params=params))
+
+    def live_artists(self):
+        return [self.steps]
+
+    def data_limits(self):
+        return self.k_values[0] - 0.5, self.k_values[-1] + 0.5, 0.0, self.values.max()
+
+
+class DashboardPlot(BasePlot):
+    """f(t), F(t), R(t) и λ(t) непрерывного распределения на одном холсте.
+
+    Все четыре кривые берутся из одной записи кэша кривых (одна сетка времени,
+    один расчет) и рисуются на осях 2×2 с общей осью x. Подписи и цвета
+    панелей берутся из классов CurvePlot в panels.
+    """
+
+    window_title = ""
+    panels = ()  # Четыре подкласса CurvePlot в порядке осей
+
+    lines = None
+
+    def create_axes(self):
+        self.figure.set_layout_engine("constrained")
+        self.axes = self.figure.subplots(2, 2, sharex=True).ravel()
+        self.ax = self.axes[0]
+
+    def update_plot(self, params):
+        curve = get_curve(params)
+        self.time = curve.time
+        self.values = [getattr(curve, panel.quantity) for panel in self.panels]
+
+        if self.lines is None:
+            self.lines = []
+            for ax, panel, values in zip(self.axes, self.panels, self.values):
+                line, = ax.plot(self.time, values, label=panel.label, color=panel.color, animated=True)
+                ax.set_title(panel.title)
+                ax.set_ylabel(panel.ylabel)
+                ax.grid()
+                ax.legend()
+                if panel.finite_ylim:
+                    _set_finite_ylim(ax, values)
+                self.lines.append(line)
+            # Ось x общая, подписываем только нижний ряд
+            for ax, panel in zip(self.axes[2:], self.panels[2:]):
+                ax.set_xlabel(panel.xlabel)
+        else:
+            for line, values in zip(self.lines, self.values):
+                line.set_data(self.time, values)
+
+    def live_artists(self):
+        return self.lines
+
+    def blit_bbox(self):
+        return self.figure.bbox
+
+    def rescale(self):
+        changed = False
+        for ax, panel, values in zip(self.axes, self.panels, self.values):
+            x0, x1, y0, y1 = _curve_limits(self.time, values)
+            if _fits(x0, x1, ax.get_xlim()) and _fits(y0, y1, ax.get_ylim()):
+                continue
+            ax.relim()
+            ax.autoscale_view()
+            if panel.finite_ylim:
+                _set_finite_ylim(ax, values)
+            changed = True
+        return changed
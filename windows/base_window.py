@@ -1,28 +1,45 @@
-from PyQt6.QtCore import Qt
+import os
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPainter, QValidator
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QStyleOption, QStyle
+    QWidget, QVBoxLayout, QStyleOption, QStyle, QMessageBox, QFileDialog
 )
 
+from engine.batch import export_scenarios, scenario_fields
+from engine.export import available_formats, export_table, horizontal_cells, vertical_cells
+from engine.fitting import FILE_FILTER, fit_file
 from windows.base_line_edit import BaseLineEdit
+from windows.task_runner import TaskRunner
 
 
 class BaseWindow(QWidget):
 
+    params_class = None  # Класс параметров распределения окна, для пакетного экспорта
+    # Параметры на листе Excel: с заголовком — столбцом начиная с export_column,
+    # без заголовка — строкой
+    export_column = "D"
+    export_title = None
+
+    # Новые параметры распределения: открытые графики окна следуют за ними
+    params_changed = pyqtSignal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self.resize(450, 200)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.setStyleSheet('''
-        BaseWindow {
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
-                stop:0 #e83a00,
-                stop:1 #005ce8);
-        }''')
 
         self.setLayout(QVBoxLayout())
 
+        # Экспорт выполняется в фоновом потоке, чтобы окно не зависало
+        self.export_task = TaskRunner(self)
+        # Пакетный экспорт не зависит от параметров окна и не отменяется их изменением
+        self.batch_task = TaskRunner(self)
+        # Оценка параметров по файлу времен отказов, тоже в фоновом потоке
+        self.fit_task = TaskRunner(self)
+
     def paintEvent(self, a0):
         opt = QStyleOption()
         opt.initFrom(self)
@@ -31,14 +48,111 @@ class BaseWindow(QWidget):
 
     def validate_number(self, input_num: BaseLineEdit):
         if input_num.text() == "":
-            input_num.change_color("white")
+            input_num.set_invalid(False)
             return False
 
         text = input_num.text()
         check = input_num.validator().validate(text, 0)[0]
         if check != QValidator.State.Acceptable:
-            input_num.change_color("black")
+            input_num.set_invalid(True)
             return False
 
-        input_num.change_color("white")
-        return True
\ No newline at end of file
+        input_num.set_invalid(False)
+        return True
+
+    def show_plot(self, plot, plot_class):
+        """Показ графика для текущих параметров окна.
+
+        Уже открытое окно графика обновляется на месте, новое создается,
+        только если прежнее не открывалось или было закрыто. Открытый график
+        затем следует за изменениями параметров окна.
+        """
+        if plot is None or sip.isdeleted(plot):
+            plot = plot_class(self.params)
+            self.params_changed.connect(plot.set_params)
+        else:
+            plot.set_params(self.params)
+        plot.show()
+        plot.raise_()
+        return plot
+
+    def get_export_file_name(self):
+        """Выбор файла экспорта; без расширения добавляется расширение выбранного формата."""
+        formats = available_formats()
+        file_name, selected = QFileDialog.getSaveFileName(self, "Экспорт данных", "",
+                                                          ";;".join(formats.values()))
+        if file_name and not os.path.splitext(file_name)[1]:
+            file_name += next((extension for extension, name in formats.items() if name == selected), ".xlsx")
+        return file_name
+
+    def export_data(self):
+        # Повторное нажатие во время экспорта отменяет его
+        if self.export_task.is_running():
+            self.export_task.cancel()
+            return
+
+        file_name = self.get_export_file_name()
+        if file_name:
+            self.export_task.start(self.write_export, file_name, self.params, self.export_column, self.export_title)
+
+    @staticmethod
+    def write_export(file_name, params, column, title, progress=None):
+        # Выполняется в фоновом потоке, поэтому берет только переданные значения, а не поля окна
+        data, parameters = params.export_data()
+
+        if title is None:
+            cells = horizontal_cells(column, parameters)
+        else:
+            cells = vertical_cells(column, title, parameters)
+
+        return export_table(file_name, params.sheet_name, data, parameters, cells, progress)
+
+    def batch_export(self):
+        """Пакетный экспорт: наборы параметров читаются из CSV, по одному в строке."""
+        # Повторное нажатие во время экспорта отменяет его
+        if self.batch_task.is_running():
+            self.batch_task.cancel()
+            return
+
+        fields = ",".join(item.name for item in scenario_fields(self.params_class))
+        scenario_file, _ = QFileDialog.getOpenFileName(self, f"Файл сценариев ({fields})", "", "CSV (*.csv)")
+        if not scenario_file:
+            return
+        file_name = self.get_export_file_name()
+        if file_name:
+            self.batch_task.start(export_scenarios, scenario_file, self.params_class, file_name)
+
+    def bind_export_button(self, button, task):
+        """Кнопка экспорта показывает ход фоновой задачи task; повторное нажатие ее отменяет."""
+        text = button.text()
+        task.progress.connect(lambda percent: button.setText(f"Отменить экспорт ({percent}%)"))
+        task.finished.connect(lambda: button.setText(text))
+        task.failed.connect(lambda error: QMessageBox.warning(self, text, str(error)))
+
+    def fit_params(self):
+        """Оценка параметров распределения по времени отказов из файла."""
+        # Повторное нажатие во время чтения файла отменяет оценку
+        if self.fit_task.is_running():
+            self.fit_task.cancel()
+            return
+
+        file_name, _ = QFileDialog.getOpenFileName(self, "Времена отказов", "", FILE_FILTER)
+        if file_name:
+            self.fit_task.start(fit_file, file_name, self.params_class)
+
+    def bind_fit_button(self, button):
+        """Кнопка оценки параметров показывает, что файл читается; повторное нажатие отменяет.
+
+        Оценки подставляются в поля окна методом set_fitted_params(params).
+        """
+        text = button.text()
+        button.clicked.connect(self.fit_params)
+        self.fit_task.result.connect(self.set_fitted_params)
+        self.fit_task.progress.connect(lambda _: button.setText("Отменить оценку параметров"))
+        self.fit_task.finished.connect(lambda: button.setText(text))
+        self.fit_task.failed.connect(lambda error: QMessageBox.warning(self, text, str(error)))
+
+    def notify_params_changed(self):
+        # Экспорт, начатый для прежних параметров, больше не нужен
+        self.export_task.cancel()
+        self.params_changed.emit(self.params)
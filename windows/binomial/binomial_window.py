@@ -1,11 +1,7 @@
-import os
-
-import numpy as np
-import pandas as pd
 from PyQt6.QtCore import QRegularExpression, pyqtSignal
-from PyQt6.QtGui import QIntValidator, QValidator, QRegularExpressionValidator
+from PyQt6.QtGui import QIntValidator, QRegularExpressionValidator
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QWidget, QFileDialog, QHBoxLayout
+    QVBoxLayout, QWidget, QHBoxLayout
 )
 
 from windows.base_button import BaseButton
@@ -13,20 +9,26 @@ from windows.base_label import BaseLabel
 from windows.base_line_edit import BaseLineEdit, FocusOutLineEdit
 from windows.base_substrate import BaseSubstrate
 from windows.base_window import BaseWindow
+from windows.recompute_scheduler import RecomputeScheduler
 from windows.binomial.binomial_plot import BinomialPlot, BinomialDensityPlot
-import scipy.stats as stats
+from engine.params import BinomialParams
 
 from decimal import Decimal
 
 
 class BinomialWindow(BaseWindow):
 
+    params_class = BinomialParams
+
     inputs_validated = pyqtSignal(bool)
     n_changed = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Пересчеты от нескольких изменений подряд выполняются один раз
+        self.recompute = RecomputeScheduler(self)
+
         self.probability_range = None
         self.plot_density_window = None
         self.plot_window = None
@@ -38,6 +40,8 @@ class BinomialWindow(BaseWindow):
         self.q = 0  # Вероятность неудачи
         self.m = 0  # Количество событий
 
+        self.params = None  # Неизменяемые параметры для расчетов
+
         self.probability_eq = 0
         self.probability_eq_less = 0
         self.k_value = 0 # Наиболее вероятное число отказов
@@ -54,10 +58,9 @@ class BinomialWindow(BaseWindow):
         self.n_label = BaseLabel("Количество испытаний (n):", sub)
         self.n_input = BaseLineEdit(sub)
         self.n_input.setPlaceholderText("Введите количество испытаний")
-        self.n_input.setValidator(QIntValidator(1, 9999999))
+        self.n_input.setValidator(QIntValidator(1, 2147483647))
         sub.layout().addWidget(self.n_label)
         sub.layout().addWidget(self.n_input)
-        self.n_input.textChanged.connect(lambda _ : self.validate_number(self.n_input))
         self.n_input.textChanged.connect(lambda _ : self.validate_inputs())
 
 
@@ -71,7 +74,6 @@ class BinomialWindow(BaseWindow):
         self.p_input.setValidator(double_validator)
         sub.layout().addWidget(self.p_label)
         sub.layout().addWidget(self.p_input)
-        self.p_input.textChanged.connect(lambda _ : self.validate_number(self.p_input))
         self.p_input.textChanged.connect(lambda _ : self.calculate_q() if self.p_input.hasFocus() else None)
         self.p_input.focusLost.connect(self.calculate_p)
         self.p_input.textChanged.connect(lambda _: self.validate_inputs())
@@ -87,7 +89,6 @@ class BinomialWindow(BaseWindow):
         self.q_input.setValidator(double_validator)
         sub.layout().addWidget(self.q_label)
         sub.layout().addWidget(self.q_input)
-        self.q_input.textChanged.connect(lambda _ : self.validate_number(self.q_input))
         self.q_input.textChanged.connect(lambda _ : self.calculate_p() if self.q_input.hasFocus() else None)
         self.q_input.focusLost.connect(self.calculate_q)
         self.q_input.textChanged.connect(lambda _: self.validate_inputs())
@@ -113,9 +114,10 @@ class BinomialWindow(BaseWindow):
         tmp.setLayout(QVBoxLayout())
 
         self.k_value_label = BaseLabel("Наиболее вероятное число отказов (k):", tmp)
+        self.k_value_label.setToolTip("Если (n + 1)·p — целое число, одинаково вероятны k и k - 1; показывается большее")
         self.k_value_input = BaseLineEdit(tmp)
         self.k_value_input.setReadOnly(True)
-        self.inputs_validated.connect(self.calculate_k)
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_k))
         tmp.layout().addWidget(self.k_value_label)
         tmp.layout().addWidget(self.k_value_input)
 
@@ -131,15 +133,14 @@ class BinomialWindow(BaseWindow):
         self.m_label = BaseLabel("Количество событий m в n испытаниях (m):", tmp2)
         self.m_input = BaseLineEdit(tmp2)
         self.m_input.setPlaceholderText("Введите количество событий m в n испытаниях")
-        self.m_input.setValidator(QIntValidator(0, 9999999))
+        self.m_input.setValidator(QIntValidator(0, 2147483647))
         tmp2.layout().addWidget(self.m_label)
         tmp2.layout().addWidget(self.m_input)
-        self.m_input.textChanged.connect(lambda _ : self.validate_number(self.m_input))
-        self.m_input.textChanged.connect(lambda _ : self.calculate_probability_eq())
-        self.m_input.textChanged.connect(lambda _ : self.calculate_probability_eq_less())
+        self.m_input.textChanged.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq))
+        self.m_input.textChanged.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq_less))
         self.n_input.textChanged.connect(lambda _ : self.change_m_validator())
-        self.inputs_validated.connect(lambda _: self.calculate_probability_eq())
-        self.inputs_validated.connect(lambda _: self.calculate_probability_eq_less())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq))
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq_less))
         tmp.layout().addWidget(tmp2)
 
 
@@ -148,14 +149,14 @@ class BinomialWindow(BaseWindow):
         self.probability_eq_input.setReadOnly(True)
         tmp.layout().addWidget(self.probability_eq_label)
         tmp.layout().addWidget(self.probability_eq_input)
-        self.n_changed.connect(lambda _ : self.calculate_probability_eq())
+        self.n_changed.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq))
 
         self.probability_eq_less_label = BaseLabel("Вероятность появления события m в n испытаниях (P(X ≤ m)):", tmp)
         self.probability_eq_less_input = BaseLineEdit(tmp)
         self.probability_eq_less_input.setReadOnly(True)
         tmp.layout().addWidget(self.probability_eq_less_label)
         tmp.layout().addWidget(self.probability_eq_less_input)
-        self.n_changed.connect(lambda _ : self.calculate_probability_eq_less())
+        self.n_changed.connect(lambda _: self.recompute.schedule(self.calculate_probability_eq_less))
 
         sub = BaseSubstrate(self)
         self.layout().addWidget(sub)
@@ -175,8 +176,7 @@ class BinomialWindow(BaseWindow):
         self.a_value_input.setValidator(QIntValidator(0, 0))
         tmp3.layout().addWidget(self.a_value_label)
         tmp3.layout().addWidget(self.a_value_input)
-        self.a_value_input.textChanged.connect(lambda _ : self.validate_number(self.a_value_input))
-        self.a_value_input.textChanged.connect(lambda _ : self.calculate_probability_range())
+        self.a_value_input.textChanged.connect(lambda _: self.recompute.schedule(self.calculate_probability_range))
         self.n_changed.connect(lambda _ : self.change_a_validator())
 
         tmp3 = QWidget(tmp)
@@ -188,11 +188,10 @@ class BinomialWindow(BaseWindow):
         self.b_value_input.setValidator(QIntValidator(0, 0))
         tmp3.layout().addWidget(self.b_value_label)
         tmp3.layout().addWidget(self.b_value_input)
-        self.b_value_input.textChanged.connect(lambda _ : self.validate_number(self.b_value_input))
-        self.b_value_input.textChanged.connect(lambda _ : self.calculate_probability_range())
+        self.b_value_input.textChanged.connect(lambda _: self.recompute.schedule(self.calculate_probability_range))
         self.n_changed.connect(lambda _: self.change_b_validator())
 
-        self.inputs_validated.connect(lambda _ : self.calculate_probability_range())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_probability_range))
 
         self.probability_range_label = BaseLabel("Вероятность появления события m в n испытаниях (P(a ≤ X ≤ b)):", tmp)
         self.probability_range_input = BaseLineEdit(tmp)
@@ -204,22 +203,14 @@ class BinomialWindow(BaseWindow):
         self.export_btn = BaseButton("Экспортировать данные")
         self.layout().addWidget(self.export_btn)
         self.export_btn.clicked.connect(self.export_data)
+        self.bind_export_button(self.export_btn, self.export_task)
         self.inputs_validated.connect(self.export_btn.setEnabled)
         self.export_btn.setEnabled(False)
 
-    def validate_number(self, input_num: BaseLineEdit):
-        if input_num.text() == "":
-            input_num.change_color("white")
-            return False
-
-        text = input_num.text()
-        check = input_num.validator().validate(text, 0)[0]
-        if check != QValidator.State.Acceptable:
-            input_num.change_color("black")
-            return False
-
-        input_num.change_color("white")
-        return True
+        self.batch_export_btn = BaseButton("Пакетный экспорт")
+        self.layout().addWidget(self.batch_export_btn)
+        self.batch_export_btn.clicked.connect(self.batch_export)
+        self.bind_export_button(self.batch_export_btn, self.batch_task)
 
     def change_m_validator(self):
         top = self.n
@@ -239,7 +230,7 @@ class BinomialWindow(BaseWindow):
             return
 
         self.m = int(self.m_input.text())
-        self.probability_eq = stats.binom.pmf(self.m, self.n, float(self.p))
+        self.probability_eq = self.params.pmf(self.m)
         self.probability_eq_input.setText(str(self.probability_eq))
         return self.probability_eq
 
@@ -251,7 +242,7 @@ class BinomialWindow(BaseWindow):
             return
 
         self.m = int(self.m_input.text())
-        self.probability_eq_less = stats.binom.cdf(self.m, self.n, float(self.p))
+        self.probability_eq_less = self.params.cdf(self.m)
         self.probability_eq_less_input.setText(str(self.probability_eq_less))
         return self.probability_eq_less
 
@@ -272,9 +263,7 @@ class BinomialWindow(BaseWindow):
     def calculate_k(self):
         self.k_value = 0
         if self.check:
-            k_values = np.arange(0, self.n + 1)
-            pmf_values = stats.binom.pmf(k_values, self.n, float(self.p))
-            self.k_value = np.argmax(pmf_values)
+            self.k_value = self.params.calculate_k()
         self.k_value_input.setText(str(self.k_value))
 
 
@@ -300,70 +289,16 @@ class BinomialWindow(BaseWindow):
         self.n_changed.emit(self.n)
         self.p = Decimal(self.p_input.text())
         self.q = Decimal(1) - Decimal(self.p)
+        self.params = BinomialParams(self.n, self.p)
+        self.recompute.schedule(self.notify_params_changed)
 
 
     def plot_distribution_density(self):
-        self.plot_density_window = BinomialDensityPlot(self.n, self.p, self.q)
-        self.plot_density_window.show()
+        self.plot_density_window = self.show_plot(self.plot_density_window, BinomialDensityPlot)
 
 
     def plot_distribution(self):
-        self.plot_window = BinomialPlot(self.n, self.p, self.q)
-        self.plot_window.show()
-
-    def export_data(self):
-        file_name, ext = QFileDialog.getSaveFileName(self, "Экспорт данных", "",
-                                                     "Excel (*.xlsx);;")
-
-        if file_name:
-            _, file_extension = os.path.splitext(file_name)
-
-            if not file_extension:
-                file_name += ".xlsx"
-
-            m_values = np.arange(0, self.n + 1)
-            pmf_values = stats.binom.pmf(m_values, self.n, float(self.p))
-            cdf_values = stats.binom.cdf(m_values, self.n, float(self.p))
-
-            data = {
-                'm': m_values,
-                'Функция распределения (CDF)': cdf_values,
-                'Плотность распределения (PMF)': pmf_values,
-            }
-
-            df = pd.DataFrame(data)
-            # Создаем объект ExcelWriter
-            with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                # Записываем данные в лист 'Poisson Data'
-                df.to_excel(writer, index=False, sheet_name='Binomial Data')
-
-                # Получаем объект Workbook для дальнейшего изменения
-                workbook = writer.book
-                sheet = workbook['Binomial Data']
-
-                sheet['D1'] = 'Размер выборки (n)'
-                sheet['D2'] = self.n
-                sheet['E1'] = 'Вероятность безотказной работы (p)'
-                sheet['E2'] = self.p
-                sheet['F1'] = 'Вероятность отказа (q)'
-                sheet['F2'] = self.q
-
-                for col in sheet.iter_cols(min_row=1, max_row=1, min_col=1, max_col=6):
-                    for cell in col:
-                        cell.font = cell.font.copy(bold=True)
-
-                # Применяем автоширину для всех столбцов
-                for column_cells in sheet.columns:
-                    max_length = 0
-                    column_letter = column_cells[0].column_letter
-                    for cell in column_cells:
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    adjusted_width = max_length + 5
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+        self.plot_window = self.show_plot(self.plot_window, BinomialPlot)
 
     def change_a_validator(self):
         top = self.n
@@ -396,7 +331,6 @@ class BinomialWindow(BaseWindow):
             self.b_value = 0
 
         self.probability_range_input.setText("")
-        if a_valid and b_valid:
-            probability_range_sum = (stats.binom.cdf(self.b_value, self.n, float(self.p))
-                                - stats.binom.cdf(self.a_value - 1, self.n, float(self.p)))
+        if a_valid and b_valid and self.params is not None:
+            probability_range_sum = self.params.calculate_probability_range(self.a_value, self.b_value)
             self.probability_range_input.setText(str(probability_range_sum))
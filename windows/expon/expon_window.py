@@ -1,11 +1,7 @@
-import os
-
-import numpy as np
-import pandas as pd
-from PyQt6.QtCore import Qt, QRegularExpression, pyqtSignal
+from PyQt6.QtCore import QRegularExpression, pyqtSignal
 from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QWidget, QFileDialog, QHBoxLayout
+    QVBoxLayout, QWidget, QHBoxLayout
 )
 
 from windows.base_button import BaseButton
@@ -13,13 +9,19 @@ from windows.base_label import BaseLabel
 from windows.base_line_edit import BaseLineEdit, FocusOutLineEdit
 from windows.base_substrate import BaseSubstrate
 from windows.base_window import BaseWindow
+from windows.recompute_scheduler import RecomputeScheduler
 from windows.expon.expon_plot import ExponDensityPlot, ExponPlot, ExponReliabilityPlot
-import scipy.stats as stats
+from engine.params import ExponParams
+from engine.curve_cache import curve_cache
 
 from decimal import Decimal
 
 class ExponWindow(BaseWindow):
 
+    params_class = ExponParams
+    export_column = "E"
+    export_title = "Параметры нормального распределения:"
+
     inputs_validated = pyqtSignal(bool)
 
     time_changed = pyqtSignal()
@@ -35,6 +37,9 @@ class ExponWindow(BaseWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Пересчеты от нескольких изменений подряд выполняются один раз
+        self.recompute = RecomputeScheduler(self)
+
         self.plot_density_window = None
         self.plot_window = None
         self.plot_reliability_window = None
@@ -44,6 +49,8 @@ class ExponWindow(BaseWindow):
         self.lambda_value = None  # Интенсивность отказа
         self.Mtbf         = None  # Средняя наработка на отказ
 
+        self.params = None  # Неизменяемые параметры для расчетов и кэша кривых
+
         self.time = None
         self.f_t = None           # Вероятность отказа
         self.reliability = None   # Вероятность безотказной работы
@@ -68,7 +75,6 @@ class ExponWindow(BaseWindow):
         self.lambda_value_input.setValidator(double_validator)
         sub.layout().addWidget(self.lambda_value_label)
         sub.layout().addWidget(self.lambda_value_input)
-        self.lambda_value_input.textChanged.connect(lambda _ : self.validate_number(self.lambda_value_input))
         self.lambda_value_input.textChanged.connect(lambda _: self.calculate_Mtbf() if self.lambda_value_input.hasFocus() else None)
         self.lambda_value_input.focusLost.connect(self.calculate_lambda_value)
         self.lambda_value_input.textChanged.connect(lambda _: self.validate_inputs())
@@ -88,6 +94,10 @@ class ExponWindow(BaseWindow):
         self.Mtbf_input.focusLost.connect(self.calculate_Mtbf)
         self.Mtbf_input.textChanged.connect(lambda _: self.validate_inputs())
 
+        self.fit_btn = BaseButton("Оценить параметры по временам отказов")
+        self.layout().addWidget(self.fit_btn)
+        self.bind_fit_button(self.fit_btn)
+
         self.plot_distribution_density_btn = BaseButton("Построить график плотности распределения")
         self.layout().addWidget(self.plot_distribution_density_btn)
         self.plot_distribution_density_btn.clicked.connect(self.plot_distribution_density)
@@ -127,7 +137,7 @@ class ExponWindow(BaseWindow):
         tmp2.layout().addWidget(self.time_input)
         self.time_input.textChanged.connect(lambda _ : self.set_time())
 
-        self.inputs_validated.connect(lambda _: self.calculate_with_time())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_with_time))
         tmp.layout().addWidget(tmp2)
 
 
@@ -188,7 +198,7 @@ class ExponWindow(BaseWindow):
                                                 if value is not None
                                                 else self.time_for_reliability_input.setText(""))
 
-        self.inputs_validated.connect(lambda _: self.calculate_time_for_reliability())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_time_for_reliability))
 
         sub = BaseSubstrate(self)
         self.layout().addWidget(sub)
@@ -220,14 +230,20 @@ class ExponWindow(BaseWindow):
                                                 if value is not None
                                                 else self.replacement_time_input.setText(""))
 
-        self.inputs_validated.connect(lambda _: self.calculate_replacement_time())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_replacement_time))
 
         self.export_btn = BaseButton("Экспортировать данные")
         self.layout().addWidget(self.export_btn)
         self.export_btn.clicked.connect(self.export_data)
+        self.bind_export_button(self.export_btn, self.export_task)
         self.inputs_validated.connect(self.export_btn.setEnabled)
         self.export_btn.setEnabled(False)
 
+        self.batch_export_btn = BaseButton("Пакетный экспорт")
+        self.layout().addWidget(self.batch_export_btn)
+        self.batch_export_btn.clicked.connect(self.batch_export)
+        self.bind_export_button(self.batch_export_btn, self.batch_task)
+
 
 
 
@@ -237,9 +253,7 @@ class ExponWindow(BaseWindow):
             self.reliability = None
             self.failure = None
         else:
-            self.f_t = stats.expon.pdf(float(self.time), scale=float(1 / self.lambda_value))
-            self.reliability = 1 - stats.expon.cdf(float(self.time), scale=float(1 / self.lambda_value))
-            self.failure = stats.expon.cdf(float(self.time), scale=float(1 / self.lambda_value))
+            self.f_t, self.reliability, self.failure = self.params.calculate_with_time(float(self.time))
 
         self.f_t_changed.emit(self.f_t)
         self.reliability_changed.emit(self.reliability)
@@ -249,7 +263,7 @@ class ExponWindow(BaseWindow):
         if (self.reliability_level is None) or (not self.check):
             self.time_for_reliability = None
         else:
-            self.time_for_reliability = stats.expon.ppf(float(1 - self.reliability_level), scale=float(1 / self.lambda_value))
+            self.time_for_reliability = self.params.calculate_time_for_reliability(float(self.reliability_level))
 
         self.time_for_reliability_changed.emit(self.time_for_reliability)
 
@@ -257,7 +271,7 @@ class ExponWindow(BaseWindow):
         if (self.max_failure_probability is None) or (not self.check):
             self.replacement_time = None
         else:
-            self.replacement_time = stats.expon.ppf(float(self.max_failure_probability), scale=float(1 / self.lambda_value))
+            self.replacement_time = self.params.calculate_replacement_time(float(self.max_failure_probability))
 
         self.replacement_time_changed.emit(self.replacement_time)
 
@@ -275,104 +289,50 @@ class ExponWindow(BaseWindow):
         return self.check
 
     def set_values(self):
+        old_params = self.params
 
         self.lambda_value = Decimal(self.lambda_value_input.text())
+        self.params = ExponParams(self.lambda_value)
+        self.recompute.schedule(self.notify_params_changed)
+
+        # Кривые прежних параметров больше не понадобятся
+        if old_params is not None and old_params != self.params:
+            curve_cache.evict(old_params)
+
+    def set_fitted_params(self, params):
+        # Поля проверяются и применяются так же, как при вводе вручную
+        self.lambda_value_input.setText(format(params.lambda_value, "f"))
+        self.calculate_Mtbf()
 
     def plot_distribution_density(self):
-        self.plot_density_window = ExponDensityPlot(self.lambda_value)
-        self.plot_density_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_density_window.show()
+        self.plot_density_window = self.show_plot(self.plot_density_window, ExponDensityPlot)
 
     def plot_distribution(self):
-        self.plot_window = ExponPlot(self.lambda_value)
-        self.plot_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_window.show()
+        self.plot_window = self.show_plot(self.plot_window, ExponPlot)
 
     def plot_reliability(self):
-        self.plot_reliability_window = ExponReliabilityPlot(self.lambda_value)
-        self.plot_reliability_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_reliability_window.show()
-
-    def export_data(self):
-        file_name, ext = QFileDialog.getSaveFileName(self, "Экспорт данных", "",
-                                                     "Excel (*.xlsx);;")
-
-        if file_name:
-            _, file_extension = os.path.splitext(file_name)
-
-            if not file_extension:
-                file_name += ".xlsx"
-
-            # Генерация диапазона временных значений
-            time_upper_limit = stats.expon.ppf(0.99, scale=float(1 / self.lambda_value))  # 99% охвата значений
-            time_values = np.linspace(0, time_upper_limit, 1000)
-
-            # Расчет характеристик распределения Вейбулла
-            pdf_values = stats.expon.pdf(time_values, scale=float(1 / self.lambda_value))
-            cdf_values = stats.expon.cdf(time_values, scale=float(1 / self.lambda_value))
-            reliability_values = 1 - cdf_values  # Вероятность безотказной работы
-
-            # Создание словаря данных
-            data = {
-                'Время': time_values,
-                'Функция распределения (CDF)': cdf_values,
-                'Плотность распределения (PDF)': pdf_values,
-                'Вероятность безотказной работы': reliability_values,
-            }
-
-            # Преобразование данных в DataFrame
-            df = pd.DataFrame(data)
-
-            # Экспорт данных в Excel
-            with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Expon Data')
-
-                # Получаем объект Workbook для дальнейшего изменения
-                workbook = writer.book
-                sheet = workbook['Expon Data']
-
-                # Записываем параметры распределения в верхнюю часть таблицы
-                sheet['E1'] = 'Параметры нормального распределения:'
-                sheet['E2'] = 'Интенсивность отказа (λ):'
-                sheet['F2'] = self.lambda_value
-
-                for col in sheet.iter_cols(min_row=1, max_row=1, min_col=1, max_col=5):
-                    for cell in col:
-                        cell.font = cell.font.copy(bold=True)
-
-                # Применяем автоширину для всех столбцов
-                for column_cells in sheet.columns:
-                    max_length = 0
-                    column_letter = column_cells[0].column_letter
-                    for cell in column_cells:
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    adjusted_width = max_length + 5
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+        self.plot_reliability_window = self.show_plot(self.plot_reliability_window, ExponReliabilityPlot)
 
     def set_time(self):
         if self.validate_number(self.time_input):
             self.time = Decimal(self.time_input.text())
         else:
             self.time = None
-        self.calculate_with_time()
+        self.recompute.schedule(self.calculate_with_time)
 
     def set_reliability_level(self):
         if self.validate_number(self.reliability_level_input):
             self.reliability_level = Decimal(self.reliability_level_input.text())
         else:
             self.reliability_level = None
-        self.calculate_time_for_reliability()
+        self.recompute.schedule(self.calculate_time_for_reliability)
 
     def set_max_failure_probability(self):
         if self.validate_number(self.max_failure_probability_input):
             self.max_failure_probability = Decimal(self.max_failure_probability_input.text())
         else:
             self.max_failure_probability = None
-        self.calculate_replacement_time()
+        self.recompute.schedule(self.calculate_replacement_time)
 
     def calculate_Mtbf(self):
         if not (self.validate_number(self.lambda_value_input)):
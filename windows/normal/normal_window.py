@@ -1,11 +1,7 @@
-import os
-
-import numpy as np
-import pandas as pd
-from PyQt6.QtCore import Qt, QRegularExpression, pyqtSignal
+from PyQt6.QtCore import QRegularExpression, pyqtSignal
 from PyQt6.QtGui import QRegularExpressionValidator
 from PyQt6.QtWidgets import (
-    QVBoxLayout, QWidget, QFileDialog, QHBoxLayout
+    QVBoxLayout, QWidget, QHBoxLayout
 )
 
 from windows.base_button import BaseButton
@@ -13,13 +9,19 @@ from windows.base_label import BaseLabel
 from windows.base_line_edit import BaseLineEdit, FocusOutLineEdit
 from windows.base_substrate import BaseSubstrate
 from windows.base_window import BaseWindow
-from windows.normal.normal_plot import NormalDensityPlot, NormalPlot, NormalReliabilityPlot, NormalFailureRatePlot
-import scipy.stats as stats
+from windows.recompute_scheduler import RecomputeScheduler
+from windows.normal.normal_plot import NormalDensityPlot, NormalPlot, NormalReliabilityPlot, NormalFailureRatePlot, NormalDashboardPlot
+from engine.params import NormalParams
+from engine.curve_cache import curve_cache
 
 from decimal import Decimal
 
 class NormalWindow(BaseWindow):
 
+    params_class = NormalParams
+    export_column = "F"
+    export_title = "Параметры нормального распределения:"
+
     inputs_validated = pyqtSignal(bool)
 
     time_changed = pyqtSignal()
@@ -35,12 +37,22 @@ class NormalWindow(BaseWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Пересчеты от нескольких изменений подряд выполняются один раз
+        self.recompute = RecomputeScheduler(self)
+
+        self.plot_density_window = None
+        self.plot_window = None
+        self.plot_reliability_window = None
+        self.plot_failure_rate_window = None
+        self.plot_dashboard_window = None
         self.setWindowTitle("Нормальное распределение")
 
         # Параметры
         self.mu = 0     # Среднее время до отказа
         self.sigma = 0  # Стандартное отклонение
 
+        self.params = None  # Неизменяемые параметры для расчетов и кэша кривых
+
         self.time = None
         self.lambda_value = None  # Интенсивность отказа
         self.f_t = None           # Вероятность отказа
@@ -64,7 +76,6 @@ class NormalWindow(BaseWindow):
         self.mu_input.setValidator(double_validator)
         sub.layout().addWidget(self.mu_label)
         sub.layout().addWidget(self.mu_input)
-        self.mu_input.textChanged.connect(lambda _ : self.validate_number(self.mu_input))
         self.mu_input.textChanged.connect(lambda _: self.validate_inputs())
 
 
@@ -78,9 +89,12 @@ class NormalWindow(BaseWindow):
         self.sigma_input.setValidator(double_validator)
         sub.layout().addWidget(self.sigma_label)
         sub.layout().addWidget(self.sigma_input)
-        self.sigma_input.textChanged.connect(lambda _ : self.validate_number(self.sigma_input))
         self.sigma_input.textChanged.connect(lambda _: self.validate_inputs())
 
+        self.fit_btn = BaseButton("Оценить параметры по временам отказов")
+        self.layout().addWidget(self.fit_btn)
+        self.bind_fit_button(self.fit_btn)
+
         self.plot_distribution_density_btn = BaseButton("Построить график плотности распределения")
         self.layout().addWidget(self.plot_distribution_density_btn)
         self.plot_distribution_density_btn.clicked.connect(self.plot_distribution_density)
@@ -108,6 +122,13 @@ class NormalWindow(BaseWindow):
         self.inputs_validated.connect(self.plot_failure_rate_btn.setEnabled)
         self.plot_failure_rate_btn.setEnabled(False)
 
+
+        self.plot_dashboard_btn = BaseButton("Построить все графики на одной панели")
+        self.layout().addWidget(self.plot_dashboard_btn)
+        self.plot_dashboard_btn.clicked.connect(self.plot_dashboard)
+        self.inputs_validated.connect(self.plot_dashboard_btn.setEnabled)
+        self.plot_dashboard_btn.setEnabled(False)
+
         sub = BaseSubstrate(self)
         self.layout().addWidget(sub)
         tmp = QWidget(sub)
@@ -128,7 +149,7 @@ class NormalWindow(BaseWindow):
         self.time_input.textChanged.connect(lambda _ : self.set_time())
         tmp.layout().addWidget(tmp2)
 
-        self.inputs_validated.connect(lambda _: self.calculate_with_time())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_with_time))
 
         self.lambda_label = BaseLabel("Интенсивность отказа (λ(t)):", tmp)
         self.lambda_input = BaseLineEdit(tmp)
@@ -188,7 +209,7 @@ class NormalWindow(BaseWindow):
                                                 if value is not None
                                                 else self.time_for_reliability_input.setText(""))
 
-        self.inputs_validated.connect(lambda _: self.calculate_time_for_reliability())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_time_for_reliability))
 
         sub = BaseSubstrate(self)
         self.layout().addWidget(sub)
@@ -221,14 +242,20 @@ class NormalWindow(BaseWindow):
                                                 if value is not None
                                                 else self.replacement_time_input.setText(""))
 
-        self.inputs_validated.connect(lambda _: self.calculate_replacement_time())
+        self.inputs_validated.connect(lambda _: self.recompute.schedule(self.calculate_replacement_time))
 
         self.export_btn = BaseButton("Экспортировать данные")
         self.layout().addWidget(self.export_btn)
         self.export_btn.clicked.connect(self.export_data)
+        self.bind_export_button(self.export_btn, self.export_task)
         self.inputs_validated.connect(self.export_btn.setEnabled)
         self.export_btn.setEnabled(False)
 
+        self.batch_export_btn = BaseButton("Пакетный экспорт")
+        self.layout().addWidget(self.batch_export_btn)
+        self.batch_export_btn.clicked.connect(self.batch_export)
+        self.bind_export_button(self.batch_export_btn, self.batch_task)
+
 
 
 
@@ -238,9 +265,7 @@ class NormalWindow(BaseWindow):
             self.f_t = None
             self.reliability = None
         else:
-            self.f_t = stats.norm.pdf(float(self.time), loc=float(self.mu), scale=float(self.sigma))
-            self.reliability = 1 - stats.norm.cdf(float(self.time), loc=float(self.mu), scale=float(self.sigma))
-            self.lambda_value = self.f_t / self.reliability
+            self.f_t, self.reliability, self.lambda_value = self.params.calculate_with_time(float(self.time))
 
         self.lambda_value_changed.emit(self.lambda_value)
         self.f_t_changed.emit(self.f_t)
@@ -250,7 +275,7 @@ class NormalWindow(BaseWindow):
         if (self.reliability_level is None) or (not self.check):
             self.time_for_reliability = None
         else:
-            self.time_for_reliability = stats.norm.ppf(float(1 - self.reliability_level), loc=float(self.mu), scale=float(self.sigma))
+            self.time_for_reliability = self.params.calculate_time_for_reliability(float(self.reliability_level))
 
         self.time_for_reliability_changed.emit(self.time_for_reliability)
 
@@ -258,7 +283,7 @@ class NormalWindow(BaseWindow):
         if (self.max_failure_probability is None) or (not self.check):
             self.replacement_time = None
         else:
-            self.replacement_time = stats.norm.ppf(float(self.max_failure_probability), loc=float(self.mu), scale=float(self.sigma))
+            self.replacement_time = self.params.calculate_replacement_time(float(self.max_failure_probability))
 
         self.replacement_time_changed.emit(self.replacement_time)
 
@@ -278,110 +303,54 @@ class NormalWindow(BaseWindow):
         return self.check
 
     def set_values(self):
+        old_params = self.params
 
         self.mu = Decimal(self.mu_input.text())
         self.sigma = Decimal(self.sigma_input.text())
+        self.params = NormalParams(self.mu, self.sigma)
+        self.recompute.schedule(self.notify_params_changed)
+
+        # Кривые прежних параметров больше не понадобятся
+        if old_params is not None and old_params != self.params:
+            curve_cache.evict(old_params)
+
+    def set_fitted_params(self, params):
+        # Поля проверяются и применяются так же, как при вводе вручную
+        self.mu_input.setText(format(params.mu, "f"))
+        self.sigma_input.setText(format(params.sigma, "f"))
 
     def plot_distribution_density(self):
-        self.plot_density_window = NormalDensityPlot(self.mu, self.sigma)
-        self.plot_density_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_density_window.show()
+        self.plot_density_window = self.show_plot(self.plot_density_window, NormalDensityPlot)
 
     def plot_distribution(self):
-        self.plot_window = NormalPlot(self.mu, self.sigma)
-        self.plot_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_window.show()
+        self.plot_window = self.show_plot(self.plot_window, NormalPlot)
 
     def plot_reliability(self):
-        self.plot_reliability_window = NormalReliabilityPlot(self.mu, self.sigma)
-        self.plot_reliability_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_reliability_window.show()
+        self.plot_reliability_window = self.show_plot(self.plot_reliability_window, NormalReliabilityPlot)
 
     def plot_failure_rate(self):
-        self.plot_failure_rate_window = NormalFailureRatePlot(self.mu, self.sigma)
-        self.plot_failure_rate_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-        self.plot_failure_rate_window.show()
-
-    def export_data(self):
-        file_name, ext = QFileDialog.getSaveFileName(self, "Экспорт данных", "",
-                                                     "Excel (*.xlsx);;")
-
-        if file_name:
-            _, file_extension = os.path.splitext(file_name)
-
-            if not file_extension:
-                file_name += ".xlsx"
-
-            # Генерация диапазона временных значений
-            time_values = np.linspace(float(self.mu - 4 * self.sigma), float(self.mu + 4 * self.sigma), 1000)
-
-            # Расчет характеристик распределения Вейбулла
-            pdf_values = stats.norm.pdf(time_values, loc=float(self.mu), scale=float(self.sigma))
-            cdf_values = stats.norm.cdf(time_values, loc=float(self.mu), scale=float(self.sigma))
-            reliability_values = 1 - cdf_values  # Вероятность безотказной работы
-            failure_rate_values = pdf_values / reliability_values  # Интенсивность отказов
-
-            # Создание словаря данных
-            data = {
-                'Время': time_values,
-                'Функция распределения (CDF)': cdf_values,
-                'Плотность распределения (PDF)': pdf_values,
-                'Вероятность безотказной работы': reliability_values,
-                'Интенсивность отказов': failure_rate_values
-            }
-
-            # Преобразование данных в DataFrame
-            df = pd.DataFrame(data)
-
-            # Экспорт данных в Excel
-            with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Normal Data')
-
-                # Получаем объект Workbook для дальнейшего изменения
-                workbook = writer.book
-                sheet = workbook['Normal Data']
-
-                # Записываем параметры распределения в верхнюю часть таблицы
-                sheet['F1'] = 'Параметры нормального распределения:'
-                sheet['F2'] = 'Среднее время до отказа (μ)'
-                sheet['G2'] = self.mu
-                sheet['F3'] = 'Стандартное отклонение (σ)'
-                sheet['G3'] = self.sigma
-
-                for col in sheet.iter_cols(min_row=1, max_row=1, min_col=1, max_col=7):
-                    for cell in col:
-                        cell.font = cell.font.copy(bold=True)
-
-                # Применяем автоширину для всех столбцов
-                for column_cells in sheet.columns:
-                    max_length = 0
-                    column_letter = column_cells[0].column_letter
-                    for cell in column_cells:
-                        try:
-                            if cell.value:
-                                max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    adjusted_width = max_length + 5
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+        self.plot_failure_rate_window = self.show_plot(self.plot_failure_rate_window, NormalFailureRatePlot)
+
+    def plot_dashboard(self):
+        self.plot_dashboard_window = self.show_plot(self.plot_dashboard_window, NormalDashboardPlot)
 
     def set_time(self):
         if self.validate_number(self.time_input):
             self.time = Decimal(self.time_input.text())
         else:
             self.time = None
-        self.calculate_with_time()
+        self.recompute.schedule(self.calculate_with_time)
 
     def set_reliability_level(self):
         if self.validate_number(self.reliability_level_input):
             self.reliability_level = Decimal(self.reliability_level_input.text())
         else:
             self.reliability_level = None
-        self.calculate_time_for_reliability()
+        self.recompute.schedule(self.calculate_time_for_reliability)
 
     def set_max_failure_probability(self):
         if self.validate_number(self.max_failure_probability_input):
             self.max_failure_probability = Decimal(self.max_failure_probability_input.text())
         else:
             self.max_failure_probability = None
-        self.calculate_replacement_time()
+        self.recompute.schedule(self.calculate_replacement_time)
@@ -0,0 +1,35 @@
+from PyQt6.QtCore import QObject, QTimer
+
+
+# Задержка пересчета в мс: 0 — в конце текущего цикла обработки событий
+DELAY = 0
+
+
+class RecomputeScheduler(QObject):
+    """Отложенный пересчет зависимых значений окна.
+
+    Все запросы, пришедшие до срабатывания таймера, объединяются, и каждая
+    функция пересчета вызывается не более одного раза в порядке первого запроса.
+    При delay > 0 таймер перезапускается на каждый запрос (debounce).
+    """
+
+    def __init__(self, parent=None, delay=DELAY):
+        super().__init__(parent)
+
+        self._pending = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, *callbacks):
+        for callback in callbacks:
+            self._pending.setdefault(callback, None)
+        self._timer.start()
+
+    def flush(self):
+        """Немедленный вызов всех отложенных пересчетов."""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for callback in pending:
+            callback()
@@ -0,0 +1,112 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class Cancelled(Exception):
+    """Задача отменена: выбрасывается из progress() внутри функции задачи."""
+
+
+class TaskSignals(QObject):
+    # Объект создается в потоке интерфейса, поэтому сигналы из рабочего потока
+    # доставляются через очередь событий
+    progress = pyqtSignal(int)
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    done = pyqtSignal()
+
+
+class Task(QRunnable):
+    """Вызов function(*args, progress=...) в потоке QThreadPool.
+
+    Функция сообщает о ходе работы вызовом progress(done, total). Этот же
+    вызов прерывает ее исключением Cancelled после cancel().
+    """
+
+    def __init__(self, function, args):
+        super().__init__()
+        # Задачу удаляет сборщик мусора Python, когда TaskRunner отпускает ссылку
+        self.setAutoDelete(False)
+
+        self.function = function
+        self.args = args
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+        self._percent = None
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def progress(self, done, total):
+        if self._cancelled.is_set():
+            raise Cancelled
+        percent = 100 * done // total if total else 100
+        # Не больше ста сигналов за задачу, чтобы не загружать очередь событий
+        if percent != self._percent:
+            self._percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        try:
+            result = self.function(*self.args, progress=self.progress)
+        except Cancelled:
+            pass
+        except Exception as error:
+            self.signals.error.emit(error)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.done.emit()
+
+
+class TaskRunner(QObject):
+    """Фоновое выполнение не более одной текущей задачи окна.
+
+    Новая задача отменяет предыдущую. Сигналы отмененной задачи, пришедшие
+    после отмены, отбрасываются, поэтому окно видит результат только последней.
+    """
+
+    progress = pyqtSignal(int)
+    result = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    # Текущая задача завершилась: успешно, с ошибкой или отменой
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+
+        self.pool = pool or QThreadPool.globalInstance()
+        self.task = None
+        # Ссылки на запущенные задачи, пока их сигналы могут прийти
+        self._tasks = set()
+
+    def start(self, function, *args):
+        self.cancel()
+        task = Task(function, args)
+        task.signals.progress.connect(lambda percent: self._relay(task, self.progress, percent))
+        task.signals.result.connect(lambda result: self._relay(task, self.result, result))
+        task.signals.error.connect(lambda error: self._relay(task, self.failed, error))
+        task.signals.done.connect(lambda: self._done(task))
+        self.task = task
+        self._tasks.add(task)
+        self.pool.start(task)
+
+    def cancel(self):
+        if self.task is None:
+            return
+        self.task.cancel()
+        self.task = None
+        self.finished.emit()
+
+    def is_running(self):
+        return self.task is not None
+
+    def _relay(self, task, signal, value):
+        if task is self.task:
+            signal.emit(value)
+
+    def _done(self, task):
+        self._tasks.discard(task)
+        if task is self.task:
+            self.task = None
+            self.finished.emit()
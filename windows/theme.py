@@ -0,0 +1,143 @@
+from PyQt6.QtWidgets import QApplication
+
+
+# Оформление всех Base* виджетов одной таблицей стилей: Qt разбирает ее один раз при запуске,
+# а не в конструкторе каждого виджета
+THEME = """
+    MainWindow, BaseWindow {
+        background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+            stop:0 #e83a00,
+            stop:1 #005ce8);
+    }
+
+    BaseSubstrate {
+        background-color: rgba(255, 255, 255, 0.15); /* Цвет фона */
+        border-radius: 15px;      /* Радиус скругления */
+    }
+
+    BaseLabel {
+        color: white; /* Цвет фона */
+        background-color: rgba(255, 255, 255, 0); /* Цвет фона */
+    }
+
+    BaseLineEdit {
+        border: 1px solid white;
+        border-radius: 10px;
+        padding: 0 8px;
+        background: rgba(255, 255, 255, 0);
+        selection-background-color: rgba(255, 255, 255, 0.5);
+        color: white;
+    }
+
+    BaseLineEdit[invalid="true"] {
+        color: black;
+    }
+
+    BaseLineEdit::placeholder {
+        color: rgba(255, 255, 255, 0.5); /* Установить красный цвет с прозрачностью */
+    }
+
+    BaseLineEdit::read-only {
+        border: 1px solid rgba(255, 255, 255, 0.5);
+    }
+
+    BaseButton {
+        border: 1px solid white;
+        border-radius: 8px;
+        padding: 0 8px;
+        background-color: rgba(255, 255, 255, 0);
+        color: white;
+    }
+
+    BaseButton:hover {
+        background-color: rgba(255, 255, 255, 0.15);
+        border: 2px solid white; /* Темный цвет границы при наведении */
+    }
+
+    BaseButton:!hover {
+        background-color: rgba(255, 255, 255, 0);
+        border: 1px solid white; /* Темный цвет границы при наведении */
+    }
+
+    /* Состояние при нажатии */
+    BaseButton:pressed {
+        background-color: rgba(255, 255, 255, 0.30);
+        border: 2px solid white; /* Темный цвет границы при нажатии */
+    }
+
+    /* Состояние при фокусе (если кнопка фокусируется, например, с клавиатуры) */
+    BaseButton:focus {
+        background-color: rgba(255, 255, 255, 0.15);
+        border: 2px solid white; /* Темный цвет границы при наведении */
+    }
+
+    /* Состояние, когда кнопка отключена */
+    BaseButton:disabled {
+        border-radius: 8px;
+        padding: 0 8px;
+        background-color: rgba(255, 255, 255, 0.1); /* Бледный фон */
+        color: rgba(255, 255, 255, 0.4);
+        border: 1px solid rgba(255, 255, 255, 0.5);
+    }
+
+    /* Состояние, когда кнопка активна (всегда видно нажатие, когда кнопка активна) */
+    BaseButton:active {
+        border-radius: 8px;
+        padding: 0 8px;
+        border: 1px solid white;
+        background-color: rgba(255, 255, 255, 0);
+        color: white;
+    }
+
+    /* Состояние, когда кнопка в режиме "ховер" и нажата одновременно */
+    BaseButton:hover:pressed {
+        background-color: rgba(255, 255, 255, 0.30);
+        border: 2px solid white; /* Темный цвет границы при нажатии */
+    }
+
+    /* Состояние, когда кнопка имеет фокус и нажата */
+    BaseButton:focus:pressed {
+        background-color: rgba(255, 255, 255, 0.30);
+        border: 2px solid white; /* Темный цвет границы при нажатии */
+    }
+
+    BaseListView {
+        background-color: rgba(255, 255, 255, 0);
+        show-decoration-selected: 1; /* make the selection span the entire width of the view */
+    }
+
+    BaseListView:item {
+        background: none;
+        border-bottom: 1px solid white; /* Нижняя граница */
+        margin: 0;
+        padding: 10px;
+        font-size: 16px;        /* Размер шрифта */
+        font-weight: bold;      /* Жирный шрифт */
+        line-height: 1.5;
+    }
+
+    BaseListView:item:selected {
+        background: rgba(255, 255, 255, 0.15);
+    }
+
+    BaseListView:item:selected:!active {
+        background: rgba(255, 255, 255, 0.15);
+    }
+
+    BaseListView:item:selected:active {
+        background: rgba(255, 255, 255, 0.15);
+    }
+
+    BaseListView:item:hover {
+        background: rgba(255, 255, 255, 0.15);
+    }
+
+    BaseListView:item:focus {
+        background: rgba(255, 255, 255, 0.15);
+    }
+"""
+
+
+def apply_theme(app: QApplication):
+    """Установка оформления приложения, вызывается один раз после создания QApplication."""
+    app.setStyleSheet(THEME)